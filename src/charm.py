@@ -4,30 +4,54 @@
 
 """Charmed operator for the OAI RAN Central Unit (CU) for K8s."""
 
+import dataclasses
+import functools
+import hashlib
 import json
 import logging
+import os
+import time
 from ipaddress import IPv4Address
-from subprocess import check_output
-from typing import List, Optional, Tuple
-
-from charms.kubernetes_charm_libraries.v0.multus import (
-    KubernetesMultusCharmLib,
-    NetworkAnnotation,
-    NetworkAttachmentDefinition,
+from typing import TYPE_CHECKING, List, Optional, Sequence
+
+from ops import (
+    ActionEvent,
+    ActiveStatus,
+    BlockedStatus,
+    CollectStatusEvent,
+    PebbleCustomNoticeEvent,
+    StatusBase,
+    WaitingStatus,
+    main,
 )
-from charms.loki_k8s.v1.loki_push_api import LogForwarder
-from charms.oai_ran_cu_k8s.v0.fiveg_f1 import F1Provides
-from charms.oai_ran_cu_k8s.v0.fiveg_f1 import PLMNConfig as F1_PLMNConfig
-from charms.sdcore_amf_k8s.v0.fiveg_n2 import N2Requires
-from charms.sdcore_nms_k8s.v0.fiveg_core_gnb import FivegCoreGnbRequires, PLMNConfig
-from jinja2 import Environment, FileSystemLoader
-from lightkube.models.meta_v1 import ObjectMeta
-from ops import ActiveStatus, BlockedStatus, CollectStatusEvent, WaitingStatus, main
 from ops.charm import CharmBase
-from ops.pebble import ExecError, Layer
+from ops.framework import StoredState
+from ops.model import ModelError
+from ops.pebble import ConnectionError as PebbleConnectionError
+from ops.pebble import Layer
+
+from pebble_stats import InstrumentedContainer, PebbleStats
+from relation_data import (
+    PLMN,
+    AmfEndpoint,
+    CoreGnbInfo,
+    read_amf_endpoint,
+    read_core_gnb_info,
+)
+from restart_timer import RESTART_DUE_NOTICE_KEY, start_restart_timer
+from route_manager import RouteManager
+
+# The charm libraries, lightkube, pydantic and jinja2 are imported where they are used rather
+# than here. Non-leader units, and leader hooks that stop early, never pay for their import.
+if TYPE_CHECKING:
+    from charms.kubernetes_charm_libraries.v0.multus import (
+        NetworkAnnotation,
+        NetworkAttachmentDefinition,
+    )
+    from jinja2 import Template
 
-from charm_config import CharmConfig, CharmConfigInvalidError, CNIType
-from k8s_privileged import K8sPrivileged
+    from k8s_multus import K8sMultus
+    from k8s_snapshot import K8sSnapshotClient
 
 logger = logging.getLogger(__name__)
 
@@ -39,53 +63,74 @@ CORE_GNB_RELATION_NAME = "fiveg_core_gnb"
 DU_F1_DEFAULT_PORT = 2152
 WORKLOAD_VERSION_FILE_NAME = "/etc/workload-version"
 LOGGING_RELATION_NAME = "logging"
+TEMPLATES_PATH = "src/templates"
+CONFIG_TEMPLATE_NAME = "cu.conf.j2"
+PEBBLE_SOCKET_PATH = "/charm/containers/{container_name}/pebble.socket"
 
 
 class OAIRANCUOperator(CharmBase):
     """Main class to describe Juju event handling for the OAI RAN CU operator for K8s."""
 
+    _stored = StoredState()
+
     def __init__(self, *args):
         super().__init__(*args)
         self.framework.observe(self.on.collect_unit_status, self._on_collect_unit_status)
         if not self.unit.is_leader():
             return
         self._container_name = self._service_name = "cu"
-        self._container = self.unit.get_container(self._container_name)
+        self._pebble_stats = PebbleStats()
+        self._container = InstrumentedContainer(
+            self.unit.get_container(self._container_name), self._pebble_stats
+        )
+        self._reconcile_status: Optional[StatusBase] = None
+        self._route_manager = RouteManager(self._container)
+        self._stored.set_default(
+            cu_config_digest="",
+            reconcile_fingerprint="",
+            last_hook_stats={},
+            multus_available=False,
+            restart_pending=False,
+            last_restart=0.0,
+            workload_version="",
+            workload_image_id="",
+        )
+        self.framework.observe(self.on.hook_stats_action, self._on_hook_stats_action)
+        self.framework.observe(self.on.config_storage_attached, self._on_config_storage_changed)
+        self.framework.observe(self.on.config_storage_detaching, self._on_config_storage_changed)
+        self.framework.observe(self.on.upgrade_charm, self._on_upgrade_charm)
+        from charms.loki_k8s.v1.loki_push_api import LogForwarder
+        from charms.oai_ran_cu_k8s.v0.fiveg_f1 import F1Provides
+        from charms.sdcore_amf_k8s.v0.fiveg_n2 import N2Requires
+        from charms.sdcore_nms_k8s.v0.fiveg_core_gnb import FivegCoreGnbRequires
+
+        from charm_config import CharmConfig, CharmConfigInvalidError
+
         self._n2_requirer = N2Requires(self, N2_RELATION_NAME)
         self._core_gnb_requirer = FivegCoreGnbRequires(self, CORE_GNB_RELATION_NAME)
         self._f1_provider = F1Provides(self, F1_RELATION_NAME)
         self._logging = LogForwarder(charm=self, relation_name=LOGGING_RELATION_NAME)
-        self._k8s_privileged = K8sPrivileged(
-            namespace=self.model.name, statefulset_name=self.app.name
-        )
         try:
             self._charm_config: CharmConfig = CharmConfig.from_charm(charm=self)
         except CharmConfigInvalidError:
             return
-        self._kubernetes_multus = KubernetesMultusCharmLib(
-            cap_net_admin=True,
-            namespace=self.model.name,
-            statefulset_name=self.model.app.name,
-            pod_name="-".join(self.model.unit.name.rsplit("/", 1)),
-            container_name=self._container_name,
-            network_annotations=self._generate_network_annotations(),
-            network_attachment_definitions=self._network_attachment_definitions_from_config(),
-            privileged=True,
-        )
 
         self.framework.observe(self.on.update_status, self._configure)
         self.framework.observe(self.on.config_changed, self._configure)
         self.framework.observe(self.on.cu_pebble_ready, self._configure)
+        self.framework.observe(self.on.cu_pebble_custom_notice, self._on_pebble_custom_notice)
         self.framework.observe(self.on.fiveg_n2_relation_joined, self._configure)
         self.framework.observe(self._n2_requirer.on.n2_information_available, self._configure)
         self.framework.observe(self.on[F1_RELATION_NAME].relation_changed, self._configure)
         self.framework.observe(self.on[CORE_GNB_RELATION_NAME].relation_changed, self._configure)
         self.framework.observe(self.on.remove, self._on_remove)
 
-    def _on_collect_unit_status(self, event: CollectStatusEvent):  # noqa C901
+    def _on_collect_unit_status(self, event: CollectStatusEvent):
         """Check the unit status and set to Unit when CollectStatusEvent is fired.
 
-        Set the workload version if present in workload
+        Reuses the result of the reconciliation when one already ran in this dispatch,
+        otherwise evaluates the reconciliation gates without configuring anything.
+
         Args:
             event: CollectStatusEvent
         """
@@ -98,93 +143,206 @@ class OAIRANCUOperator(CharmBase):
             event.add_status(BlockedStatus("Scaling is not implemented for this charm"))
             logger.info("Scaling is not implemented for this charm")
             return
+        if self._reconcile_status is None:
+            self._reconcile_status = self._reconcile(configure=False)
+        if not isinstance(self._reconcile_status, ActiveStatus):
+            logger.info(self._reconcile_status.message)
+        event.add_status(self._reconcile_status)
+        self._record_pebble_stats()
+
+    def _record_pebble_stats(self) -> None:
+        """Log the Pebble calls made during this dispatch and keep them if it ran a hook."""
+        dispatch_path = os.environ.get("JUJU_DISPATCH_PATH", "")
+        logger.debug("%s: %s", dispatch_path, self._pebble_stats.summary())
+        if dispatch_path.startswith("hooks/"):
+            self._stored.last_hook_stats = {
+                "hook": dispatch_path.removeprefix("hooks/").replace("_", "-"),
+                **self._pebble_stats.as_dict(),
+            }
+
+    def _on_hook_stats_action(self, event: ActionEvent) -> None:
+        """Report the Pebble calls made during the last hook."""
+        if not self._stored.last_hook_stats:
+            event.fail("No hook has been recorded yet")
+            return
+        event.set_results({"pebble": dict(self._stored.last_hook_stats)})
+
+    def _configure(self, _) -> None:
+        fingerprint = ""
+        if (
+            self._stored.reconcile_fingerprint
+            and not self._stored.restart_pending
+            and self._workload_is_alive()
+        ):
+            fingerprint = self._reconcile_fingerprint()
+            if fingerprint == self._stored.reconcile_fingerprint:
+                logger.debug("Reconcile inputs unchanged since the last successful reconcile")
+                self._reconcile_status = ActiveStatus()
+                return
+        self._reconcile_status = self._reconcile(configure=True)
+        if isinstance(self._reconcile_status, ActiveStatus):
+            self._stored.reconcile_fingerprint = fingerprint or self._reconcile_fingerprint()
+        else:
+            self._stored.reconcile_fingerprint = ""
+
+    def _reconcile_fingerprint(self) -> str:
+        """Return a digest of every input of the reconciliation.
+
+        The workload image is accounted for through the workload version it ships.
+
+        Returns:
+            str: Hex digest of the charm config, relation data, Pod IP and workload version
+        """
+        inputs = {
+            "config": dict(self.model.config),
+            "relations": {
+                relation_name: [
+                    (relation.id, dict(relation.data[relation.app]) if relation.app else {})
+                    for relation in self.model.relations[relation_name]
+                ]
+                for relation_name in (N2_RELATION_NAME, CORE_GNB_RELATION_NAME, F1_RELATION_NAME)
+            },
+            "pod_ip": self._pod_ip,
+            "workload_version": self._stored.workload_version,
+        }
+        return hashlib.sha256(json.dumps(inputs, sort_keys=True, default=str).encode()).hexdigest()
+
+    def _workload_is_alive(self) -> bool:
+        """Return whether the CU service is running in the workload container.
+
+        A restarted container (new image, rescheduled Pod) comes back with an empty Pebble
+        plan, so this also tells whether the previous reconcile still holds.
+        """
+        try:
+            services = self._container.get_services(self._service_name)
+        except (PebbleConnectionError, ModelError):
+            return False
+        service = services.get(self._service_name)
+        return service is not None and service.is_running()
+
+    def _reconcile(self, configure: bool) -> StatusBase:  # noqa C901
+        """Evaluate the workload preconditions in order, each of them once.
+
+        When `configure` is set, each gate first fixes what the charm can fix itself (Multus
+        resources, statefulset patch, N3 route, relation data) and, once every gate passes,
+        the CU config file and the Pebble layer are applied.
+
+        Args:
+            configure: Whether to configure the workload or only evaluate its state
+
+        Returns:
+            StatusBase: Status of the first failing gate, or ActiveStatus if all passed.
+        """
+        from charms.kubernetes_charm_libraries.v0.multus import KubernetesMultusError
+
+        from charm_config import CharmConfig, CharmConfigInvalidError
+
         try:
             self._charm_config: CharmConfig = CharmConfig.from_charm(charm=self)
         except CharmConfigInvalidError as exc:
-            event.add_status(BlockedStatus(exc.msg))
-            return
-        if not self._kubernetes_multus.multus_is_available():
-            event.add_status(BlockedStatus("Multus is not installed or enabled"))
-            logger.info("Multus is not installed or enabled")
-            return
-        if not self._kubernetes_multus.is_ready():
-            event.add_status(WaitingStatus("Waiting for Multus to be ready"))
-            logger.info("Waiting for Multus to be ready")
-            return
+            return BlockedStatus(exc.msg)
+        if not self._multus_is_available():
+            return BlockedStatus("Multus is not installed or enabled")
+        try:
+            if configure:
+                self._kubernetes_multus.configure()
+            multus_is_ready = self._kubernetes_multus.is_ready()
+        except KubernetesMultusError as e:
+            logger.error("Failed to reconcile Multus: %s", e.message)
+            self._stored.multus_available = False
+            return BlockedStatus(e.message)
+        if not multus_is_ready:
+            return WaitingStatus("Waiting for Multus to be ready")
         if not self._container.can_connect():
-            event.add_status(WaitingStatus("Waiting for container to be ready"))
-            logger.info("Waiting for container to be ready")
-            return
-        if not _get_pod_ip():
-            event.add_status(WaitingStatus("Waiting for Pod IP address to be available"))
-            logger.info("Waiting for Pod IP address to be available")
-            return
-        if not self._k8s_privileged.is_patched(container_name=self._container_name):
-            event.add_status(WaitingStatus("Waiting for statefulset to be patched"))
-            logger.info("Waiting for statefulset to be patched")
-            return
-        self.unit.set_workload_version(self._get_workload_version())
+            return WaitingStatus("Waiting for container to be ready")
+        if not self._pod_ip:
+            return WaitingStatus("Waiting for Pod IP address to be available")
+        self._update_workload_version()
         if not self._container.exists(path=BASE_CONFIG_PATH):
-            event.add_status(WaitingStatus("Waiting for storage to be attached"))
-            logger.info("Waiting for storage to be attached")
-            return
+            return WaitingStatus("Waiting for storage to be attached")
+        n3_route_exists: Optional[bool] = None
+        if configure:
+            # The N3 route and the F1 relation data only depend on the fiveg_core_gnb
+            # relation, they are set up before the N2 gates so that the DU can proceed
+            # while the CU waits for the AMF.
+            self._update_fiveg_core_gnb_relation_data()
+            if self._relation_created(CORE_GNB_RELATION_NAME):
+                n3_route_exists = self._n3_route_exists() or self._create_n3_route()
+                self._update_fiveg_f1_relation_data()
         if not self._relation_created(N2_RELATION_NAME):
-            event.add_status(BlockedStatus("Waiting for N2 relation to be created"))
-            logger.info("Waiting for N2 relation to be created")
-            return
-        if not self._n2_requirer.amf_hostname:
-            event.add_status(WaitingStatus("Waiting for N2 information"))
-            logger.info("Waiting for N2 information")
-            return
+            return BlockedStatus("Waiting for N2 relation to be created")
+        if not self._amf_endpoint:
+            return WaitingStatus("Waiting for N2 information")
         if not self._relation_created(CORE_GNB_RELATION_NAME):
-            event.add_status(BlockedStatus("Waiting for fiveg_core_gnb relation to be created"))
-            logger.info("Waiting for fiveg_core_gnb relation to be created")
-            return
-        if not self._n3_route_exists():
-            event.add_status(WaitingStatus("Waiting for the N3 route to be created"))
-            logger.info("Waiting for the N3 route to be created")
-            return
-        if not self._core_gnb_requirer.tac or not self._core_gnb_requirer.plmns:
-            event.add_status(WaitingStatus("Waiting for TAC and PLMNs configuration"))
-            return
-        event.add_status(ActiveStatus())
+            return BlockedStatus("Waiting for fiveg_core_gnb relation to be created")
+        if n3_route_exists is None:
+            n3_route_exists = self._n3_route_exists()
+        if not n3_route_exists:
+            return WaitingStatus("Waiting for the N3 route to be created")
+        if not self._core_gnb_info:
+            return WaitingStatus("Waiting for TAC and PLMNs configuration")
+        if configure:
+            cu_config = self._generate_cu_config()
+            if config_update_required := not self._is_cu_config_up_to_date(cu_config):
+                self._write_config_file(content=cu_config)
+            self._configure_pebble(restart=config_update_required)
+        return ActiveStatus()
+
+    @functools.cached_property
+    def _k8s_client(self) -> "K8sSnapshotClient":
+        """The per-dispatch Kubernetes cache shared by the charm's Kubernetes reads."""
+        from k8s_snapshot import K8sSnapshotClient
+
+        return K8sSnapshotClient()
+
+    @functools.cached_property
+    def _kubernetes_multus(self) -> "K8sMultus":
+        """The Multus helper, built on first use and kept for the rest of the dispatch.
+
+        Hooks that stop before touching Kubernetes never build the NADs and annotations.
 
-    def _configure(self, _) -> None:  # noqa C901
-        try:
-            self._charm_config: CharmConfig = CharmConfig.from_charm(charm=self)
-        except CharmConfigInvalidError:
-            return
-        if not self._kubernetes_multus.multus_is_available():
-            return
-        self._kubernetes_multus.configure()
-        if not self._kubernetes_multus.is_ready():
-            return
-        if not self._container.can_connect():
-            return
-        if not self._container.exists(path=BASE_CONFIG_PATH):
-            return
-        if not _get_pod_ip():
-            return
-        if not self._relation_created(CORE_GNB_RELATION_NAME):
-            return
-        self._update_fiveg_core_gnb_relation_data()
-        if not self._k8s_privileged.is_patched(container_name=self._container_name):
-            self._k8s_privileged.patch_statefulset(container_name=self._container_name)
-        if not self._n3_route_exists():
-            self._create_n3_route()
-        if not self._core_gnb_requirer.tac or not self._core_gnb_requirer.plmns:
-            return
-        self._update_fiveg_f1_relation_data()
+        Returns:
+            K8sMultus: Multus helper sharing a per-dispatch Kubernetes cache
+        """
+        from k8s_multus import K8sMultus
 
-        if not self._relation_created(N2_RELATION_NAME):
-            return
-        if not self._n2_requirer.amf_hostname:
+        return K8sMultus(
+            client=self._k8s_client,
+            cap_net_admin=True,
+            namespace=self.model.name,
+            statefulset_name=self.model.app.name,
+            pod_name=self._pod_name,
+            container_name=self._container_name,
+            network_annotations=self._generate_network_annotations(),
+            network_attachment_definitions=self._network_attachment_definitions_from_config(),
+            privileged=True,
+        )
+
+    def _multus_is_available(self) -> bool:
+        """Return whether Multus is available in the cluster.
+
+        A positive probe is remembered for the life of the unit. It is forgotten whenever a
+        Multus call fails, so that the next hook probes the cluster again.
+        """
+        if not self._stored.multus_available:
+            self._stored.multus_available = bool(self._kubernetes_multus.multus_is_available())
+        return self._stored.multus_available
+
+    def _on_pebble_custom_notice(self, event: PebbleCustomNoticeEvent) -> None:
+        """Reconfigure the workload when the restart timer reports a deferred restart is due."""
+        if event.notice.key != RESTART_DUE_NOTICE_KEY:
             return
-        cu_config = self._generate_cu_config()
-        if config_update_required := not self._is_cu_config_up_to_date(cu_config):
-            self._write_config_file(content=cu_config)
-        service_restart_required = config_update_required
-        self._configure_pebble(restart=service_restart_required)
+        logger.info("Deferred restart reported as due by the restart timer")
+        self._configure(event)
+
+    def _on_config_storage_changed(self, _) -> None:
+        """Forget the digest of the pushed CU config when the config storage changes."""
+        self._stored.cu_config_digest = ""
+        self._stored.reconcile_fingerprint = ""
+
+    def _on_upgrade_charm(self, _) -> None:
+        """Force a full reconcile after an upgrade, new charm code may configure differently."""
+        self._stored.reconcile_fingerprint = ""
 
     def _on_remove(self, _) -> None:
         """Handle the remove event."""
@@ -193,27 +351,26 @@ class OAIRANCUOperator(CharmBase):
         self._kubernetes_multus.remove()
 
     def _n3_route_exists(self) -> bool:
-        """Return whether the specified route exist."""
-        try:
-            stdout, stderr = self._exec_command_in_workload_container(command="ip route show")
-        except ExecError as e:
-            logger.error("Failed retrieving routes: %s", e.stderr)
-            return False
-        for line in stdout.splitlines():
-            if f"{self._charm_config.upf_subnet} via {self._charm_config.n3_gateway_ip}" in line:
-                return True
-        return False
+        """Return whether the route to the UPF subnet via the N3 gateway exists."""
+        return self._route_manager.route_exists(
+            destination=str(self._charm_config.upf_subnet),
+            gateway=str(self._charm_config.n3_gateway_ip),
+        )
 
-    def _create_n3_route(self) -> None:
-        """Create ip route for the N3 connectivity."""
-        try:
-            self._exec_command_in_workload_container(
-                command=f"ip route replace {self._charm_config.upf_subnet} via {self._charm_config.n3_gateway_ip}"  # noqa: E501
-            )
-        except ExecError as e:
-            logger.error("Failed to create N3 route: %s", e.stderr)
-            return
+    def _create_n3_route(self) -> bool:
+        """Create ip route for the N3 connectivity.
+
+        Returns:
+            bool: Whether the route is in place.
+        """
+        if not self._route_manager.replace_route(
+            destination=str(self._charm_config.upf_subnet),
+            gateway=str(self._charm_config.n3_gateway_ip),
+        ):
+            logger.error("Failed to create N3 route")
+            return False
         logger.info("N3 route created")
+        return True
 
     def _relation_created(self, relation_name: str) -> bool:
         """Return whether a given Juju relation was created.
@@ -227,9 +384,7 @@ class OAIRANCUOperator(CharmBase):
         return bool(self.model.relations.get(relation_name))
 
     def _generate_cu_config(self) -> str:
-        tac = self._core_gnb_requirer.tac
-        plmns = self._core_gnb_requirer.plmns
-        if not tac or not plmns:
+        if not (core_gnb_info := self._core_gnb_info):
             logger.warning("TAC and PLMNs config are not available")
             return ""
         if self._f1_provider.requirer_f1_port:
@@ -242,11 +397,11 @@ class OAIRANCUOperator(CharmBase):
         if not (
             self._charm_config.f1_ip_address
             and self._charm_config.n3_ip_address
-            and (n2_ip_address := _get_pod_ip())
+            and (n2_ip_address := self._pod_ip)
         ):
             logger.warning("Interfaces ip addresses are not available")
             return ""
-        if not self._n2_requirer.amf_ip_address:
+        if not (amf_endpoint := self._amf_endpoint):
             logger.warning("AMF IP address not available")
             return ""
         return _render_config_file(
@@ -258,17 +413,19 @@ class OAIRANCUOperator(CharmBase):
             cu_n2_ip_address=n2_ip_address,
             cu_n3_interface_name=self._charm_config.n3_interface_name,
             cu_n3_ip_address=str(self._charm_config.n3_ip_address).split("/")[0],
-            amf_external_address=self._n2_requirer.amf_ip_address,
-            tac=tac,
-            plmns=plmns,
+            amf_external_address=amf_endpoint.ip_address,
+            tac=core_gnb_info.tac,
+            plmns=core_gnb_info.plmns,
         )
 
-    def _generate_network_annotations(self) -> List[NetworkAnnotation]:
+    def _generate_network_annotations(self) -> List["NetworkAnnotation"]:
         """Generate a list of NetworkAnnotations to be used by CU's StatefulSet.
 
         Returns:
             List[NetworkAnnotation]: List of NetworkAnnotations
         """
+        from charms.kubernetes_charm_libraries.v0.multus import NetworkAnnotation
+
         return [
             NetworkAnnotation(
                 name=f"{self.app.name}-{self._charm_config.n3_interface_name}-net",
@@ -314,6 +471,8 @@ class OAIRANCUOperator(CharmBase):
     def _add_cni_type_to_nad_config(
         self, nad_config: dict, master_interface: str, bridge: str
     ) -> dict:
+        from charm_config import CNIType
+
         if self._charm_config.cni_type == CNIType.macvlan:
             nad_config.update(
                 {
@@ -325,16 +484,20 @@ class OAIRANCUOperator(CharmBase):
             nad_config.update({"type": "bridge", "bridge": bridge})
         return nad_config
 
-    def _network_attachment_definitions_from_config(self) -> list[NetworkAttachmentDefinition]:
+    def _network_attachment_definitions_from_config(self) -> list["NetworkAttachmentDefinition"]:
         """Return list of Multus NetworkAttachmentDefinitions to be created based on config."""
+        from lightkube.models.meta_v1 import ObjectMeta
+
+        from k8s_multus import CanonicalNetworkAttachmentDefinition
+
         return [
-            NetworkAttachmentDefinition(
+            CanonicalNetworkAttachmentDefinition(
                 metadata=ObjectMeta(
                     name=f"{self.app.name}-{self._charm_config.n3_interface_name}-net"
                 ),
                 spec={"config": json.dumps(self._get_n3_nad_config())},
             ),
-            NetworkAttachmentDefinition(
+            CanonicalNetworkAttachmentDefinition(
                 metadata=ObjectMeta(
                     name=f"{self.app.name}-{self._charm_config.f1_interface_name}-net"
                 ),
@@ -345,15 +508,23 @@ class OAIRANCUOperator(CharmBase):
     def _is_cu_config_up_to_date(self, content: str) -> bool:
         """Check whether the CU config file content matches the actual charm configuration.
 
+        The digest of the last pushed config file is kept in the charm state, so that the file
+        only needs to be pulled from the workload when that digest is not known, for instance
+        after the config storage was re-attached.
+
         Args:
             content (str): desired config file content
 
         Returns:
             True if config is up-to-date else False
         """
-        return self._config_file_is_written() and self._config_file_content_matches(
-            content=content
-        )
+        digest = _config_file_digest(content)
+        if self._stored.cu_config_digest:
+            return self._stored.cu_config_digest == digest
+        if self._config_file_is_written() and self._config_file_content_matches(content=content):
+            self._stored.cu_config_digest = digest
+            return True
+        return False
 
     def _config_file_is_written(self) -> bool:
         return bool(self._container.exists(f"{BASE_CONFIG_PATH}/{CONFIG_FILE_NAME}"))
@@ -366,23 +537,56 @@ class OAIRANCUOperator(CharmBase):
 
     def _write_config_file(self, content: str) -> None:
         self._container.push(source=content, path=f"{BASE_CONFIG_PATH}/{CONFIG_FILE_NAME}")
+        self._stored.cu_config_digest = _config_file_digest(content)
         logger.info("Config file written")
 
     def _configure_pebble(self, restart=False) -> None:
-        """Configure the Pebble layer.
+        """Configure the Pebble layer and restart the CU service at most once.
+
+        A layer change is applied through `replan`, which already restarts the service, so
+        a config change made at the same time does not restart it a second time. A restart
+        needed within `restart-debounce-seconds` of the previous one is recorded as pending
+        and performed once the window is over.
 
         Args:
             restart (bool): Whether to restart the CU container.
         """
         plan = self._container.get_plan()
-        if plan.services != self._cu_pebble_layer.services:
+        if layer_changed := plan.services != self._cu_pebble_layer.services:
             self._container.add_layer(self._container_name, self._cu_pebble_layer, combine=True)
-            self._container.replan()
             logger.info("New layer added: %s", self._cu_pebble_layer)
-        if restart:
-            self._container.restart(self._service_name)
-            logger.info("Restarted container %s", self._service_name)
+        if not (layer_changed or restart or self._stored.restart_pending):
+            return
+        if self._restart_is_debounced():
             return
+        if layer_changed:
+            self._container.replan()
+        else:
+            self._container.restart(self._service_name)
+        self._stored.restart_pending = False
+        self._stored.last_restart = time.time()
+        logger.info("Restarted container %s", self._service_name)
+
+    def _restart_is_debounced(self) -> bool:
+        """Defer the restart if the CU service was restarted less than a window ago.
+
+        The first start of the service is never deferred, there is nothing to disrupt yet.
+
+        Returns:
+            bool: Whether the restart was deferred
+        """
+        window = self._charm_config.restart_debounce_seconds
+        remaining = self._stored.last_restart + window - time.time()
+        if remaining <= 0 or not self._workload_is_alive():
+            return False
+        self._stored.restart_pending = True
+        start_restart_timer(
+            delay=remaining,
+            pod_name=self._pod_name,
+            pebble_socket=PEBBLE_SOCKET_PATH.format(container_name=self._container_name),
+        )
+        logger.info("Restart of %s deferred by %.0f s", self._service_name, remaining)
+        return True
 
     def _update_fiveg_core_gnb_relation_data(self) -> None:
         """Publish gNB name `fiveg_core_gnb` relation data bag."""
@@ -403,34 +607,52 @@ class OAIRANCUOperator(CharmBase):
         if not (f1_ip := self._charm_config.f1_ip_address):
             logger.error("F1 IP address is not available")
             return
-        core_gnb_tac = self._core_gnb_requirer.tac
-        core_gnb_plmns = self._core_gnb_requirer.plmns
-        if not core_gnb_tac or not core_gnb_plmns:
+        if not (core_gnb_info := self._core_gnb_info):
             return
-        f1_plmns = [F1_PLMNConfig(**vars(plmn)) for plmn in core_gnb_plmns]
+        from charms.oai_ran_cu_k8s.v0.fiveg_f1 import PLMNConfig as F1_PLMNConfig
+
+        f1_plmns = [F1_PLMNConfig(**dataclasses.asdict(plmn)) for plmn in core_gnb_info.plmns]
         self._f1_provider.set_f1_information(
             ip_address=f1_ip.split("/")[0],
             port=self._charm_config.f1_port,
-            tac=core_gnb_tac,
+            tac=core_gnb_info.tac,
             plmns=f1_plmns,
         )
 
-    def _exec_command_in_workload_container(
-        self, command: str, timeout: Optional[int] = 30, environment: Optional[dict] = None
-    ) -> Tuple[str, str | None]:
-        """Execute command in the workload container.
+    @functools.cached_property
+    def _pod_ip(self) -> Optional[str]:
+        """The Pod IP address, read once per dispatch from the `fiveg_n2` binding.
 
-        Args:
-            command: Command to execute
-            timeout: Timeout in seconds
-            environment: Environment Variables
+        Reading the binding runs the `network-get` hook tool, caching the address keeps it
+        to one call per dispatch.
+
+        Returns:
+            str: The Pod IP address, or None if it is not available yet.
         """
-        process = self._container.exec(
-            command=command.split(),
-            timeout=timeout,
-            environment=environment,
-        )
-        return process.wait_output()
+        try:
+            binding = self.model.get_binding(N2_RELATION_NAME)
+            bind_address = binding.network.bind_address if binding else None
+        except ModelError as e:
+            logger.warning("Failed retrieving the Pod IP address: %s", e)
+            return None
+        if not isinstance(bind_address, IPv4Address):
+            return None
+        return str(bind_address)
+
+    @functools.cached_property
+    def _amf_endpoint(self) -> Optional[AmfEndpoint]:
+        """The AMF N2 endpoint published over `fiveg_n2`, read once per dispatch."""
+        return read_amf_endpoint(self._n2_requirer)
+
+    @functools.cached_property
+    def _core_gnb_info(self) -> Optional[CoreGnbInfo]:
+        """The TAC and PLMNs published over `fiveg_core_gnb`, read once per dispatch."""
+        return read_core_gnb_info(self._core_gnb_requirer)
+
+    @property
+    def _pod_name(self) -> str:
+        """The name of the unit's Pod, e.g. `oai-ran-cu-k8s-0`."""
+        return "-".join(self.model.unit.name.rsplit("/", 1))
 
     @property
     def _gnb_name(self) -> str:
@@ -468,6 +690,37 @@ class OAIRANCUOperator(CharmBase):
             "TZ": "UTC",
         }
 
+    def _update_workload_version(self) -> None:
+        """Publish the workload version, reading it from the container for a new image only.
+
+        The version file ships with the `cu-image` resource, so the version is kept along with
+        the ID of the image it was read from. The Pod was already read by the Multus checks
+        in this dispatch, so looking the image up costs no API call.
+        """
+        image_id = self._workload_image_id()
+        if image_id and image_id == self._stored.workload_image_id:
+            return
+        version = self._get_workload_version()
+        if version != self._stored.workload_version:
+            self.unit.set_workload_version(version)
+            self._stored.workload_version = version
+        self._stored.workload_image_id = image_id or ""
+
+    def _workload_image_id(self) -> Optional[str]:
+        """Return the ID of the image the workload container runs, if Kubernetes reports it."""
+        from lightkube.core.exceptions import ApiError
+        from lightkube.resources.core_v1 import Pod
+
+        try:
+            pod = self._k8s_client.get(Pod, name=self._pod_name, namespace=self.model.name)
+        except ApiError as e:
+            logger.warning("Failed to look the workload image up: %s", e)
+            return None
+        for status in (pod.status and pod.status.containerStatuses) or []:
+            if status.name == self._container_name:
+                return status.imageID or None
+        return None
+
     def _get_workload_version(self) -> str:
         """Return the workload version.
 
@@ -484,6 +737,11 @@ class OAIRANCUOperator(CharmBase):
         return ""
 
 
+def _config_file_digest(content: str) -> str:
+    """Return the SHA-256 digest of a config file content."""
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
 def _render_config_file(
     *,
     gnb_name: str,
@@ -496,7 +754,7 @@ def _render_config_file(
     cu_n3_ip_address: str,
     amf_external_address: str,
     tac: int,
-    plmns: list[PLMNConfig],
+    plmns: Sequence[PLMN],
 ) -> str:
     """Render CU config file based on parameters.
 
@@ -516,9 +774,7 @@ def _render_config_file(
     Returns:
         str: Rendered CU configuration file
     """
-    jinja2_env = Environment(loader=FileSystemLoader("src/templates"))
-    template = jinja2_env.get_template("cu.conf.j2")
-    return template.render(
+    return _get_config_template().render(
         gnb_name=gnb_name,
         cu_f1_interface_name=cu_f1_interface_name,
         cu_f1_ip_address=cu_f1_ip_address,
@@ -533,14 +789,24 @@ def _render_config_file(
     )
 
 
-def _get_pod_ip() -> Optional[str]:
-    """Return the pod IP using juju client.
+@functools.lru_cache(maxsize=None)
+def _get_config_template() -> "Template":
+    """Return the compiled CU config template.
+
+    The template is compiled once per process. The compiled bytecode is also cached on disk,
+    keyed on the template source checksum, so that later hooks skip the compilation too.
 
     Returns:
-        str: The pod IP.
+        Template: CU config template
     """
-    ip_address = check_output(["unit-get", "private-address"])
-    return str(IPv4Address(ip_address.decode().strip())) if ip_address else None
+    from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+    jinja2_env = Environment(
+        loader=FileSystemLoader(TEMPLATES_PATH),
+        bytecode_cache=FileSystemBytecodeCache(),
+        auto_reload=False,
+    )
+    return jinja2_env.get_template(CONFIG_TEMPLATE_NAME)
 
 
 if __name__ == "__main__":  # pragma: nocover
@@ -5,9 +5,11 @@
 """Config of the Charm."""
 
 import dataclasses
+import functools
 import logging
 from enum import Enum
 from ipaddress import IPv4Address, IPv4Network, ip_network
+from typing import Any, Tuple, Union
 
 import ops
 from pydantic import (  # pylint: disable=no-name-in-module,import-error
@@ -51,7 +53,7 @@ def to_kebab(name: str) -> str:
 class CUConfig(BaseModel):  # pylint: disable=too-few-public-methods
     """Represent the OAI RAN CU operator builtin configuration values."""
 
-    model_config = ConfigDict(alias_generator=to_kebab, use_enum_values=True)
+    model_config = ConfigDict(alias_generator=to_kebab, use_enum_values=True, frozen=True)
     cni_type: CNIType = CNIType.bridge
     f1_interface_name: StrictStr = Field(default="f1", min_length=1)
     f1_ip_address: str = Field(default="192.168.254.7/24")
@@ -60,6 +62,7 @@ class CUConfig(BaseModel):  # pylint: disable=too-few-public-methods
     n3_ip_address: str = Field(default="192.168.251.6/24")
     n3_gateway_ip: IPv4Address = Field(default=IPv4Address("192.168.251.1"))
     upf_subnet: IPvAnyNetwork = Field(default=IPv4Network("192.168.252.0/24"))
+    restart_debounce_seconds: int = Field(default=0, ge=0)
 
     @field_validator("f1_ip_address", "n3_ip_address", mode="before")
     @classmethod
@@ -82,6 +85,7 @@ class CharmConfig:
         n3_ip_address: IP address used by n3 interface
         upf_subnet: Subnet for UPF n3 interface
         n3_gateway_ip: Gateway IP address to the UPF Network.
+        restart_debounce_seconds: Minimum number of seconds between two CU restarts.
     """
 
     cni_type: CNIType
@@ -92,6 +96,7 @@ class CharmConfig:
     n3_ip_address: str
     upf_subnet: IPvAnyNetwork
     n3_gateway_ip: IPv4Address
+    restart_debounce_seconds: int
 
     def __init__(self, *, cu_config: CUConfig):
         """Initialize a new instance of the CharmConfig class.
@@ -107,27 +112,50 @@ class CharmConfig:
         self.n3_ip_address = cu_config.n3_ip_address
         self.upf_subnet = cu_config.upf_subnet
         self.n3_gateway_ip = cu_config.n3_gateway_ip
+        self.restart_debounce_seconds = cu_config.restart_debounce_seconds
 
     @classmethod
     def from_charm(
         cls,
         charm: ops.CharmBase,
     ) -> "CharmConfig":
-        """Initialize a new instance of the CharmState class from the associated charm."""
-        try:
-            # ignoring because pyright fails with:
-            # "float" is incompatible with "int"
-            return cls(cu_config=CUConfig(**dict(charm.config.items())))  # type: ignore[reportArgumentType]
-        except ValidationError as exc:
-            error_fields: list = []
-            for error in exc.errors():
-                if param := error["loc"]:
-                    error_fields.extend(param)
-                else:
-                    value_error_msg: ValueError = error["ctx"]["error"]  # type: ignore[reportTypedDictNotRequiredAccess]
-                    error_fields.extend(str(value_error_msg).split())
-            error_fields.sort()
-            error_field_str = ", ".join(f"'{f}'" for f in error_fields)
-            raise CharmConfigInvalidError(
-                f"The following configurations are not valid: [{error_field_str}]"
-            ) from exc
+        """Initialize a new instance of the CharmState class from the associated charm.
+
+        Each distinct set of raw config values is validated once per process, hence once per
+        dispatch. Every call returns a new instance, or raises a new error.
+        """
+        validated = _validate_config(tuple(sorted(charm.config.items())))
+        if isinstance(validated, CharmConfigInvalidError):
+            raise CharmConfigInvalidError(validated.msg)
+        return cls(cu_config=validated)
+
+
+@functools.lru_cache(maxsize=8)
+def _validate_config(
+    config_items: Tuple[Tuple[str, Any], ...],
+) -> Union[CUConfig, CharmConfigInvalidError]:
+    """Validate the raw charm config values.
+
+    Args:
+        config_items: Sorted items of the charm config
+
+    Returns:
+        CUConfig: Validated and frozen config, or the error describing the invalid values.
+    """
+    try:
+        # ignoring because pyright fails with:
+        # "float" is incompatible with "int"
+        return CUConfig(**dict(config_items))  # type: ignore[reportArgumentType]
+    except ValidationError as exc:
+        error_fields: list = []
+        for error in exc.errors():
+            if param := error["loc"]:
+                error_fields.extend(param)
+            else:
+                value_error_msg: ValueError = error["ctx"]["error"]  # type: ignore[reportTypedDictNotRequiredAccess]
+                error_fields.extend(str(value_error_msg).split())
+        error_fields.sort()
+        error_field_str = ", ".join(f"'{f}'" for f in error_fields)
+        return CharmConfigInvalidError(
+            f"The following configurations are not valid: [{error_field_str}]"
+        )
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# Copyright 2024 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Module used to wake the charm up later through a Pebble custom notice.
+
+A hook cannot wait for something to happen. When the charm needs to run again after a
+delay, it starts this module as a detached process. The process sleeps, then records a
+Pebble custom notice in the workload container, which Juju delivers to the charm as a
+`<container>-pebble-custom-notice` event.
+
+At most one process runs per PID file. The process removes its PID file before recording
+the notice, so that the hook handling the notice can start a new one straight away.
+"""
+
+import argparse
+import logging
+import os
+import subprocess
+import sys
+import time
+
+from ops import pebble
+
+logger = logging.getLogger(__name__)
+
+
+def start_delayed_notice(key: str, delay: float, pebble_socket: str, pid_file: str) -> bool:
+    """Record the notice `key` in `delay` seconds, unless a process already waits to do so.
+
+    Args:
+        key: Key of the Pebble custom notice
+        delay: Number of seconds to wait before recording the notice
+        pebble_socket: Path to the Pebble socket of the workload container
+        pid_file: Path of the file holding the PID of the waiting process
+
+    Returns:
+        bool: Whether a new process was started
+    """
+    if process_is_running(pid_file):
+        return False
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            os.path.abspath(__file__),
+            f"--key={key}",
+            f"--delay={delay}",
+            f"--pebble-socket={pebble_socket}",
+            f"--pid-file={pid_file}",
+        ],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    with open(pid_file, "w") as f:
+        f.write(str(process.pid))
+    return True
+
+
+def process_is_running(pid_file: str) -> bool:
+    """Return whether the process whose PID is in `pid_file` is alive."""
+    try:
+        pid = _read_pid(pid_file)
+        os.kill(pid, 0)
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+def record_notice(key: str, pebble_socket: str, pid_file: str) -> None:
+    """Release the PID file, if it is ours, and record the notice.
+
+    Args:
+        key: Key of the Pebble custom notice
+        pebble_socket: Path to the Pebble socket of the workload container
+        pid_file: Path of the file holding the PID of the waiting process
+    """
+    try:
+        if _read_pid(pid_file) == os.getpid():
+            os.remove(pid_file)
+    except (OSError, ValueError):
+        pass
+    pebble.Client(socket_path=pebble_socket).notify(pebble.NoticeType.CUSTOM, key)
+
+
+def _read_pid(pid_file: str) -> int:
+    with open(pid_file) as f:
+        return int(f.read().strip())
+
+
+def main(argv=None) -> None:
+    """Sleep for the given delay and record the notice."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--key", required=True)
+    parser.add_argument("--delay", type=float, required=True)
+    parser.add_argument("--pebble-socket", required=True)
+    parser.add_argument("--pid-file", required=True)
+    args = parser.parse_args(argv)
+    time.sleep(args.delay)
+    record_notice(key=args.key, pebble_socket=args.pebble_socket, pid_file=args.pid_file)
+
+
+if __name__ == "__main__":  # pragma: nocover
+    main()
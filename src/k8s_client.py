@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+# Copyright 2024 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Module providing the lightkube Client shared by the charm's Kubernetes helpers."""
+
+import functools
+import logging
+
+import httpx
+from lightkube.config.client_adapter import user_cert, verify_cluster
+from lightkube.config.kubeconfig import KubeConfig
+from lightkube.core.client import Client
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=None)
+def get_client() -> Client:
+    """Return the process-wide lightkube Client.
+
+    The in-cluster configuration is loaded once and every Kubernetes helper talks to the
+    API server through the same connection pool. Idle connections are kept alive for as
+    long as the process runs, so the TLS handshake is paid once per hook.
+
+    Returns:
+        Client: lightkube Client
+    """
+    config = KubeConfig.from_env().get()
+    transport = httpx.HTTPTransport(
+        verify=verify_cluster(config.cluster, config.abs_file),
+        cert=user_cert(config.user, config.abs_file),
+        limits=httpx.Limits(keepalive_expiry=None),
+    )
+    logger.debug("Creating lightkube client for %s", config.cluster.server)
+    return Client(config=config, transport=transport)
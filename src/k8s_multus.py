@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# Copyright 2024 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Module adapting the Multus charm library to the charm's Kubernetes access.
+
+The library is vendored from Charmhub and must stay identical to its published version, so
+the charm's changes to its behaviour live in the subclasses below.
+"""
+
+import functools
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from json.decoder import JSONDecodeError
+from typing import Callable, Dict, List, Optional, cast
+
+import httpx
+from charms.kubernetes_charm_libraries.v0.multus import (
+    KubernetesClient,
+    KubernetesMultusCharmLib,
+    KubernetesMultusError,
+    NetworkAnnotation,
+    NetworkAttachmentDefinition,
+)
+from lightkube.core.client import Client
+from lightkube.core.exceptions import ApiError
+
+from k8s_snapshot import K8sSnapshotClient
+
+logger = logging.getLogger(__name__)
+
+CREATED_BY_LABEL = "app.juju.is/created-by"
+
+
+class CanonicalNetworkAttachmentDefinition(NetworkAttachmentDefinition):
+    """NetworkAttachmentDefinition comparing its CNI config once parsed.
+
+    The API server may hand the CNI config JSON string back with another key order or
+    whitespace, which is the same config. As a subclass, its `__eq__` takes precedence over
+    the library's string comparison on both sides of `==`, including in the library's own
+    `network_attachment_definition_is_created` check.
+    """
+
+    def __eq__(self, other):
+        """Return whether both objects have the same name and the same parsed spec."""
+        if not isinstance(other, NetworkAttachmentDefinition):
+            return NotImplemented
+        if not self.metadata or not other.metadata:
+            return False
+        if self.metadata.name != other.metadata.name:
+            return False
+        return _canonical_spec(self.spec) == _canonical_spec(other.spec)
+
+
+def _canonical_spec(spec: Optional[dict]) -> Optional[dict]:
+    """Return the NetworkAttachmentDefinition spec with its CNI config parsed."""
+    if not spec or not isinstance(spec.get("config"), str):
+        return spec
+    try:
+        return {**spec, "config": json.loads(spec["config"])}
+    except JSONDecodeError:
+        return spec
+
+
+class K8sMultusClient(KubernetesClient):
+    """Multus library Kubernetes calls, made through the charm's per-dispatch snapshot."""
+
+    def __init__(self, namespace: str, client: K8sSnapshotClient):
+        # The parent constructor builds its own lightkube Client, loading the in-cluster
+        # config again. The snapshot serves every Client method the library calls.
+        self.client = cast(Client, client)
+        self.namespace = namespace
+
+    def list_network_attachment_definitions(
+        self, labels: Optional[Dict[str, str]] = None
+    ) -> list[NetworkAttachmentDefinition]:
+        """List NetworkAttachmentDefinitions in the namespace.
+
+        Args:
+            labels: Only list the NetworkAttachmentDefinitions carrying these labels. The
+                filtering is done by the API server.
+
+        Returns:
+            list[NetworkAttachmentDefinition]: List of NetworkAttachmentDefinitions
+        """
+        try:
+            return list(
+                self.client.list(
+                    res=NetworkAttachmentDefinition, namespace=self.namespace, labels=labels
+                )
+            )
+        except ApiError:
+            raise KubernetesMultusError("Could not list NetworkAttachmentDefinitions")
+
+    def multus_is_available(self) -> bool:
+        """Check whether Multus is enabled leveraging existence of NAD custom resource.
+
+        Only the first page of a single-item list is requested, so the probe costs one small
+        request whatever the number of NetworkAttachmentDefinitions.
+
+        Returns:
+            bool: Whether Multus is enabled
+        """
+        try:
+            next(
+                iter(
+                    self.client.list(
+                        res=NetworkAttachmentDefinition, namespace=self.namespace, chunk_size=1
+                    )
+                ),
+                None,
+            )
+        except ApiError as e:
+            if e.status.reason == "NotFound":
+                logger.debug("NetworkAttachmentDefinition resource not found")
+            elif e.status.reason == "Unauthorized":
+                logger.debug("kube-apiserver not ready yet")
+            else:
+                raise KubernetesMultusError(
+                    "Unexpected outcome when checking for Multus availability"
+                )
+            return False
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return False
+            raise KubernetesMultusError("Unexpected outcome when checking for Multus availability")
+        return True
+
+
+class K8sMultus(KubernetesMultusCharmLib):
+    """Multus helper sharing the charm's Kubernetes snapshot."""
+
+    def __init__(
+        self,
+        client: K8sSnapshotClient,
+        network_attachment_definitions: List[NetworkAttachmentDefinition],
+        network_annotations: List[NetworkAnnotation],
+        namespace: str,
+        statefulset_name: str,
+        pod_name: str,
+        container_name: str,
+        cap_net_admin: bool = False,
+        privileged: bool = False,
+    ):
+        """Create instance of the K8sMultus.
+
+        The parent constructor is not called, as it would build a `KubernetesClient` of its
+        own. The attributes it sets are set here instead.
+
+        Args:
+            client: Per-dispatch Kubernetes snapshot to read and write through
+            network_attachment_definitions: list of `NetworkAttachmentDefinition` to be created.
+            network_annotations: List of `NetworkAnnotation` to be added to the container.
+            namespace: Kubernetes namespace
+            statefulset_name: Statefulset name
+            pod_name: Pod name
+            container_name: Container name
+            cap_net_admin: Container requires NET_ADMIN capability
+            privileged: Container requires privileged security context
+        """
+        self.namespace = namespace
+        self.statefulset_name = statefulset_name
+        self.pod_name = pod_name
+        self.kubernetes = K8sMultusClient(namespace=namespace, client=client)
+        self.network_attachment_definitions = network_attachment_definitions
+        self.network_annotations = network_annotations
+        self.container_name = container_name
+        self.cap_net_admin = cap_net_admin
+        self.privileged = privileged
+
+    def _configure_network_attachment_definitions(self) -> None:
+        """Configure NetworkAttachmentDefinitions in Kubernetes.
+
+        1. Lists the NetworkAttachmentDefinitions created by this charm, using the
+           `app.juju.is/created-by` label Juju sets on the objects a charm creates.
+        2. Deletes the ones that are no longer wanted or whose spec changed.
+        3. Creates the wanted ones that do not exist yet or whose spec changed.
+        4. Restarts the Pod if any existing NetworkAttachmentDefinition was deleted or
+           modified, so that the new configs take effect.
+        """
+        desired = {
+            nad.metadata.name: nad
+            for nad in self.network_attachment_definitions
+            if nad.metadata and nad.metadata.name
+        }
+        existing: Dict[str, NetworkAttachmentDefinition] = {}
+        for nad in self.kubernetes.list_network_attachment_definitions(
+            labels={CREATED_BY_LABEL: self.statefulset_name}
+        ):
+            if not nad.metadata or not nad.metadata.name:
+                logger.warning("NetworkAttachmentDefinition has no name")
+                continue
+            existing[nad.metadata.name] = nad
+        # NetworkAttachmentDefinitions are dicts, `!=` would compare them as such.
+        to_delete = [
+            name
+            for name, nad in existing.items()
+            if not (name in desired and desired[name] == nad)
+        ]
+        to_create = [
+            nad for name, nad in desired.items() if name not in existing or name in to_delete
+        ]
+        for name in to_delete:
+            self.kubernetes.delete_network_attachment_definition(name=name)
+        for nad in to_create:
+            self.kubernetes.create_network_attachment_definition(network_attachment_definition=nad)
+        if to_delete:
+            logger.warning("Restarting pod to make the new NAD configs effective.")
+            self.delete_pod()
+
+    def is_ready(self) -> bool:
+        """Return whether Multus is ready.
+
+        Validates that the network attachment definitions are created, that the statefulset is
+        patched with the appropriate Multus annotations and capabilities and that the pod
+        also contains the same annotations and capabilities. Those checks are independent
+        reads, they are made concurrently so that the call takes as long as the slowest one.
+
+        Returns:
+            bool: Whether Multus is ready
+        """
+        checks: List[Callable[[], bool]] = [
+            functools.partial(
+                self.kubernetes.network_attachment_definition_is_created,
+                network_attachment_definition=network_attachment_definition,
+            )
+            for network_attachment_definition in self.network_attachment_definitions
+        ]
+        checks.extend([self._statefulset_is_patched, self._pod_is_ready])
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            futures = [executor.submit(check) for check in checks]
+            results = [future.result() for future in futures]
+        return all(results)
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# Copyright 2024 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Module used to share Kubernetes reads between the charm's Kubernetes helpers."""
+
+import logging
+import threading
+from typing import Any, Dict, Iterator, Optional, Tuple, Type
+
+from lightkube.core.client import Client
+
+from k8s_client import get_client
+
+logger = logging.getLogger(__name__)
+
+
+class K8sSnapshotClient:
+    """Read-through cache in front of a lightkube Client.
+
+    The charm builds one instance per dispatch and hands it to every Kubernetes helper, so
+    that a given object (or list of objects) is only fetched once per hook. Any write made
+    through this client drops the cached entries for the resource kind it touched.
+
+    The cache may be shared by threads reading concurrently. Two threads missing on the same
+    key both fetch it, the last one to return wins.
+    """
+
+    def __init__(self, client: Optional[Client] = None):
+        self._client = client
+        self._objects: Dict[Tuple[Type, str, Optional[str]], Any] = {}
+        self._lists: Dict[Tuple[Type, Optional[str], Tuple], list] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> Client:
+        """Return the underlying lightkube Client, defaulting to the process-wide one."""
+        if self._client is None:
+            self._client = get_client()
+        return self._client
+
+    def get(self, res: Type, name: str, *, namespace: Optional[str] = None, **kwargs) -> Any:
+        """Return the object from the snapshot, fetching it on a cache miss."""
+        key = (res, name, namespace)
+        with self._lock:
+            if key in self._objects:
+                return self._objects[key]
+            if (listed := self._lookup_listed(res, name, namespace)) is not None:
+                return listed
+        obj = self.client.get(res, name, namespace=namespace, **kwargs)
+        with self._lock:
+            self._objects[key] = obj
+        return obj
+
+    def list(self, res: Type, *, namespace: Optional[str] = None, **kwargs) -> Iterator[Any]:
+        """Return an iterator over the listed objects, listing them on a cache miss.
+
+        Chunked lists are passed through without being cached, so that a caller reading only
+        the first items does not fetch the following pages.
+        """
+        if kwargs.get("chunk_size"):
+            return iter(self.client.list(res, namespace=namespace, **kwargs))
+        key = (res, namespace, tuple(sorted((k, repr(v)) for k, v in kwargs.items())))
+        with self._lock:
+            listed = self._lists.get(key)
+        if listed is None:
+            listed = list(self.client.list(res, namespace=namespace, **kwargs))
+            with self._lock:
+                self._lists[key] = listed
+        return iter(listed)
+
+    def create(self, obj: Any, name: Optional[str] = None, **kwargs) -> Any:
+        """Create the object and invalidate the cached entries for its kind."""
+        self.invalidate(type(obj))
+        return self.client.create(obj, name, **kwargs)
+
+    def patch(self, res: Type, name: str, obj: Any, **kwargs) -> Any:
+        """Patch the object and invalidate the cached entries for its kind."""
+        self.invalidate(res)
+        return self.client.patch(res, name, obj, **kwargs)
+
+    def replace(self, obj: Any, name: Optional[str] = None, **kwargs) -> Any:
+        """Replace the object and invalidate the cached entries for its kind."""
+        self.invalidate(type(obj))
+        return self.client.replace(obj, name, **kwargs)
+
+    def delete(self, res: Type, name: str, **kwargs) -> None:
+        """Delete the object and invalidate the cached entries for its kind."""
+        self.invalidate(res)
+        self.client.delete(res, name, **kwargs)
+
+    def invalidate(self, res: Optional[Type] = None) -> None:
+        """Drop the cached objects and lists of the given kind, or everything if not given.
+
+        Args:
+            res: lightkube resource class to invalidate
+        """
+        with self._lock:
+            if res is None:
+                self._objects.clear()
+                self._lists.clear()
+                return
+            for cache in (self._objects, self._lists):
+                for key in [key for key in cache if _same_kind(key[0], res)]:
+                    del cache[key]
+
+    def _lookup_listed(self, res: Type, name: str, namespace: Optional[str]) -> Optional[Any]:
+        """Return the object named `name` from any list of the same kind, if it was listed.
+
+        Filtered lists only hold a subset of the objects, so a miss there proves nothing, but
+        a hit is as good as a GET. Must be called with the lock held.
+        """
+        for (listed_res, listed_namespace, _), listed in self._lists.items():
+            if (listed_res, listed_namespace) != (res, namespace):
+                continue
+            for obj in listed:
+                if obj.metadata and obj.metadata.name == name:
+                    return obj
+        return None
+
+
+def _same_kind(cached: Type, res: Type) -> bool:
+    """Return whether two lightkube resource classes describe the same kind."""
+    return issubclass(cached, res) or issubclass(res, cached)
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# Copyright 2024 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Module used to account for the Pebble calls made by the charm during a hook."""
+
+import logging
+import time
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    TextIO,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from ops import Container
+from ops.pebble import ExecProcess, Layer, Plan, ServiceInfo
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class PebbleStats:
+    """Number of calls and time spent per Pebble operation."""
+
+    def __init__(self):
+        self.calls: Dict[str, int] = {}
+        self.durations: Dict[str, float] = {}
+
+    @property
+    def total_calls(self) -> int:
+        """Return the number of Pebble calls made."""
+        return sum(self.calls.values())
+
+    @property
+    def total_duration(self) -> float:
+        """Return the time spent in Pebble calls, in seconds."""
+        return sum(self.durations.values())
+
+    def record(self, operation: str, duration: float) -> None:
+        """Record a call to a Pebble operation.
+
+        Args:
+            operation: Name of the Container method
+            duration: Time spent in the call, in seconds
+        """
+        self.calls[operation] = self.calls.get(operation, 0) + 1
+        self.durations[operation] = self.durations.get(operation, 0.0) + duration
+
+    def summary(self) -> str:
+        """Return a one-line summary of the recorded calls."""
+        operations = ", ".join(
+            f"{operation}={count}" for operation, count in sorted(self.calls.items())
+        )
+        return (
+            f"{self.total_calls} Pebble calls in {self.total_duration * 1000:.1f} ms"
+            f" ({operations or 'none'})"
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the recorded calls, keyed the way Juju accepts action results."""
+        return {
+            "calls": {_result_key(operation): n for operation, n in self.calls.items()},
+            "durations-ms": {
+                _result_key(operation): round(duration * 1000, 3)
+                for operation, duration in self.durations.items()
+            },
+            "total-calls": self.total_calls,
+            "total-duration-ms": round(self.total_duration * 1000, 3),
+        }
+
+
+class InstrumentedContainer:
+    """Wrapper around an ops Container recording the Pebble operations made through it.
+
+    Only the operations the charm uses are exposed. For `exec`, the time spent waiting for
+    the process is accounted to the call as well.
+    """
+
+    def __init__(self, container: Container, stats: PebbleStats):
+        self._container = container
+        self._stats = stats
+
+    def can_connect(self) -> bool:
+        """Return whether Pebble in the container can be reached."""
+        return self._timed("can_connect", self._container.can_connect)
+
+    def exists(self, path: str) -> bool:
+        """Return whether a path exists in the container."""
+        return self._timed("exists", lambda: self._container.exists(path))
+
+    def pull(self, path: str) -> Union[BinaryIO, TextIO]:
+        """Return a readable file-like object for a text file in the container."""
+        return self._timed("pull", lambda: self._container.pull(path))
+
+    def push(self, path: str, source: str) -> None:
+        """Write text to a file in the container."""
+        self._timed("push", lambda: self._container.push(path, source))
+
+    def get_plan(self) -> Plan:
+        """Return the current Pebble plan of the container."""
+        return self._timed("get_plan", self._container.get_plan)
+
+    def get_services(self, *service_names: str) -> Mapping[str, ServiceInfo]:
+        """Return the status of the given services, or of all of them if none is given."""
+        return self._timed("get_services", lambda: self._container.get_services(*service_names))
+
+    def add_layer(self, label: str, layer: Layer, *, combine: bool = False) -> None:
+        """Add a layer to the Pebble plan of the container."""
+        self._timed("add_layer", lambda: self._container.add_layer(label, layer, combine=combine))
+
+    def replan(self) -> None:
+        """Replan the services of the container, restarting those whose config changed."""
+        self._timed("replan", self._container.replan)
+
+    def restart(self, *service_names: str) -> None:
+        """Restart the given services."""
+        self._timed("restart", lambda: self._container.restart(*service_names))
+
+    def exec(
+        self, command: List[str], *, stdin: Optional[str] = None, timeout: Optional[float] = None
+    ) -> "_TimedProcess":
+        """Run a command in the container."""
+        process = self._timed(
+            "exec", lambda: self._container.exec(command, stdin=stdin, timeout=timeout)
+        )
+        return _TimedProcess(process, self._stats)
+
+    def _timed(self, operation: str, call: Callable[[], T]) -> T:
+        start = time.perf_counter()
+        try:
+            return call()
+        finally:
+            self._stats.record(operation, time.perf_counter() - start)
+
+
+class _TimedProcess:
+    """Wrapper around a Pebble ExecProcess accounting its wait time to the `exec` call."""
+
+    def __init__(self, process: ExecProcess[str], stats: PebbleStats):
+        self._process = process
+        self._stats = stats
+
+    def wait_output(self) -> Tuple[str, Optional[str]]:
+        """Wait for the process to finish and return its output."""
+        start = time.perf_counter()
+        try:
+            return self._process.wait_output()
+        finally:
+            duration = time.perf_counter() - start
+            self._stats.durations["exec"] = self._stats.durations.get("exec", 0.0) + duration
+
+
+def _result_key(operation: str) -> str:
+    return operation.replace("_", "-")
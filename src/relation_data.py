@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# Copyright 2024 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Immutable views of the data published by the charm's related applications.
+
+The charm reads each relation once per dispatch into one of these views, so that the
+relation data is parsed and validated once however many times the reconcile needs it.
+"""
+
+import dataclasses
+from typing import TYPE_CHECKING, Optional, Tuple
+
+if TYPE_CHECKING:
+    from charms.sdcore_amf_k8s.v0.fiveg_n2 import N2Requires
+    from charms.sdcore_nms_k8s.v0.fiveg_core_gnb import FivegCoreGnbRequires
+
+
+@dataclasses.dataclass(frozen=True)
+class AmfEndpoint:
+    """AMF N2 endpoint published over the `fiveg_n2` relation."""
+
+    ip_address: str
+    hostname: str
+    port: int
+
+
+@dataclasses.dataclass(frozen=True)
+class PLMN:
+    """PLMN served by the CU."""
+
+    mcc: str
+    mnc: str
+    sst: int
+    sd: Optional[int] = None
+
+
+@dataclasses.dataclass(frozen=True)
+class CoreGnbInfo:
+    """TAC and PLMNs published by the 5G core over the `fiveg_core_gnb` relation."""
+
+    tac: int
+    plmns: Tuple[PLMN, ...]
+
+
+def read_amf_endpoint(requirer: "N2Requires") -> Optional[AmfEndpoint]:
+    """Return the AMF N2 endpoint published over `fiveg_n2`.
+
+    The relation data is read and validated with a single call to the library, rather than
+    once for each of the `amf_ip_address`, `amf_hostname` and `amf_port` properties.
+
+    Args:
+        requirer: `fiveg_n2` requirer of the charm
+
+    Returns:
+        AmfEndpoint: AMF IP address, hostname and port, or None if they are not available.
+    """
+    if not (remote_app_relation_data := requirer._get_remote_app_relation_data()):
+        return None
+    return AmfEndpoint(
+        ip_address=remote_app_relation_data["amf_ip_address"],
+        hostname=remote_app_relation_data["amf_hostname"],
+        port=int(remote_app_relation_data["amf_port"]),
+    )
+
+
+def read_core_gnb_info(requirer: "FivegCoreGnbRequires") -> Optional[CoreGnbInfo]:
+    """Return the TAC and PLMNs published over `fiveg_core_gnb`.
+
+    Args:
+        requirer: `fiveg_core_gnb` requirer of the charm
+
+    Returns:
+        CoreGnbInfo: TAC and PLMNs, or None if either of them is not available.
+    """
+    tac = requirer.tac
+    plmns = requirer.plmns
+    if not tac or not plmns:
+        return None
+    return CoreGnbInfo(
+        tac=tac,
+        plmns=tuple(PLMN(mcc=plmn.mcc, mnc=plmn.mnc, sst=plmn.sst, sd=plmn.sd) for plmn in plmns),
+    )
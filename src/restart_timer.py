@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# Copyright 2024 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Module used to tell the charm when a deferred workload restart is due.
+
+Restarting the CU drops every UE and re-runs the F1 and NG setups, so the charm does not
+restart it more than once per debounce window. When a restart is needed inside the window,
+the charm records it as pending and asks for a Pebble custom notice once the window is over.
+"""
+
+import logging
+import os
+import tempfile
+
+from delayed_notice import start_delayed_notice
+
+logger = logging.getLogger(__name__)
+
+RESTART_DUE_NOTICE_KEY = "canonical.com/oai-ran-cu-k8s/restart-due"
+
+
+def start_restart_timer(delay: float, pod_name: str, pebble_socket: str) -> None:
+    """Start the restart timer in the background, unless one is already running.
+
+    A running timer already covers the pending restart, whatever change is added to it.
+
+    Args:
+        delay: Number of seconds after which the restart is due
+        pod_name: Name of the Pod, used to name the PID file
+        pebble_socket: Path to the Pebble socket of the workload container
+    """
+    started = start_delayed_notice(
+        key=RESTART_DUE_NOTICE_KEY,
+        delay=delay,
+        pebble_socket=pebble_socket,
+        pid_file=_pid_file(pod_name),
+    )
+    if not started:
+        logger.debug("Restart timer already running")
+        return
+    logger.info("Restart timer started, due in %.0f s", delay)
+
+
+def _pid_file(pod_name: str) -> str:
+    return os.path.join(tempfile.gettempdir(), f"{pod_name}-restart-timer.pid")
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# Copyright 2024 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Module used to manage IP routes in the workload container."""
+
+import ipaddress
+import json
+import logging
+from dataclasses import dataclass
+from typing import List, Optional
+
+from ops.pebble import ExecError
+
+from pebble_stats import InstrumentedContainer
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Route:
+    """IP route as reported by the workload's routing table."""
+
+    destination: str
+    gateway: Optional[str] = None
+    device: Optional[str] = None
+
+
+class RouteManager:
+    """Class used to look up and install routes in the workload container.
+
+    Routes are read through iproute2's JSON output, which is filtered on the destination
+    prefix, so the charm never parses the whole routing table. Installing a route and reading
+    it back happens in a single `ip -batch` process, hence in a single Pebble exec.
+    """
+
+    def __init__(self, container: InstrumentedContainer, timeout: int = 30):
+        self._container = container
+        self._timeout = timeout
+
+    def get_routes(self, destination: str) -> List[Route]:
+        """Return the routes whose destination is exactly the given prefix.
+
+        Args:
+            destination: Destination prefix, e.g. `192.168.252.0/24`
+
+        Returns:
+            List[Route]: Matching routes, empty if there are none or they could not be read.
+        """
+        try:
+            stdout = self._ip("route", "show", "to", "exact", destination)
+        except ExecError as e:
+            logger.error("Failed retrieving routes: %s", e.stderr)
+            return []
+        return _parse_routes(stdout)
+
+    def route_exists(self, destination: str, gateway: str) -> bool:
+        """Return whether a route to `destination` via `gateway` exists.
+
+        Args:
+            destination: Destination prefix
+            gateway: Gateway IP address
+
+        Returns:
+            bool: Whether the route exists
+        """
+        return Route(_normalize(destination), gateway) in self._comparable(
+            self.get_routes(destination)
+        )
+
+    def replace_route(self, destination: str, gateway: str) -> bool:
+        """Install (or replace) the route to `destination` via `gateway`.
+
+        Args:
+            destination: Destination prefix
+            gateway: Gateway IP address
+
+        Returns:
+            bool: Whether the route is in place once the call returns
+        """
+        batch = f"route replace {destination} via {gateway}\nroute show to exact {destination}\n"
+        try:
+            stdout = self._ip("-batch", "-", stdin=batch)
+        except ExecError as e:
+            logger.error("Failed to create route to %s: %s", destination, e.stderr)
+            return False
+        routes = self._comparable(_parse_routes(stdout))
+        return Route(_normalize(destination), gateway) in routes
+
+    def _ip(self, *args: str, stdin: Optional[str] = None) -> str:
+        process = self._container.exec(
+            command=["ip", "-json", *args],
+            stdin=stdin,
+            timeout=self._timeout,
+        )
+        stdout, _ = process.wait_output()
+        return stdout
+
+    @staticmethod
+    def _comparable(routes: List[Route]) -> List[Route]:
+        return [Route(_normalize(route.destination), route.gateway) for route in routes]
+
+
+def _normalize(destination: str) -> str:
+    """Return the destination prefix in its canonical form.
+
+    iproute2 prints host routes without their prefix length (`10.0.0.1` rather than
+    `10.0.0.1/32`), and keywords such as `default` are kept as they are.
+    """
+    try:
+        return str(ipaddress.ip_network(destination, strict=False))
+    except ValueError:
+        return destination
+
+
+def _parse_routes(stdout: str) -> List[Route]:
+    """Parse the JSON output of `ip -json route show`.
+
+    In batch mode `ip` prints one JSON document per command, commands without output
+    print nothing, so every non-empty line is parsed separately.
+    """
+    routes: List[Route] = []
+    for line in stdout.splitlines():
+        if not line.strip():
+            continue
+        try:
+            entries = json.loads(line)
+        except json.JSONDecodeError:
+            logger.error("Unexpected output from ip: %s", line)
+            continue
+        routes.extend(
+            Route(
+                destination=entry.get("dst", ""),
+                gateway=entry.get("gateway"),
+                device=entry.get("dev"),
+            )
+            for entry in entries
+        )
+    return routes
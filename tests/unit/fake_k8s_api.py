@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+# Copyright 2024 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""In-process stand-in for the Kubernetes API server.
+
+It serves the StatefulSet, Pod and NetworkAttachmentDefinition endpoints used by the charm
+over plain HTTP on localhost, keeps the objects in memory and records every request it
+receives, so that tests can run the real Kubernetes helpers and count their API calls.
+"""
+
+import copy
+import json
+import re
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+JUJU_CREATED_BY_LABEL = "app.juju.is/created-by"
+
+_PATH_RE = re.compile(
+    r"^(?P<prefix>/api/v1|/apis/[^/]+/[^/]+)/namespaces/(?P<namespace>[^/]+)"
+    r"/(?P<plural>[^/]+)(?:/(?P<name>[^/]+))?$"
+)
+
+_KINDS: Dict[Tuple[str, str], str] = {
+    ("/apis/apps/v1", "statefulsets"): "StatefulSet",
+    ("/api/v1", "pods"): "Pod",
+    ("/apis/k8s.cni.cncf.io/v1", "network-attachment-definitions"): (
+        "NetworkAttachmentDefinition"
+    ),
+}
+
+
+@dataclass(frozen=True)
+class ApiRequest:
+    """Request received by the fake API server."""
+
+    method: str
+    path: str
+    duration: float
+    client_port: int
+    query: str = ""
+
+
+class FakeK8sApi:
+    """Fake Kubernetes API server running in a background thread.
+
+    Objects created through the API get the `app.juju.is/created-by` label, the way Juju's
+    admission webhook labels the objects created by a charm.
+    """
+
+    def __init__(self, created_by: str, multus_installed: bool = True, latency: float = 0.0):
+        self.created_by = created_by
+        self.multus_installed = multus_installed
+        self.latency = latency
+        self.requests: List[ApiRequest] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._objects: Dict[Tuple[str, str, str, str], dict] = {}
+        self._resource_version = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._server.daemon_threads = True
+        self._server.api = self  # type: ignore[attr-defined]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        """Return the base URL of the server."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> None:
+        """Start serving requests."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop serving requests."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def add(self, obj: dict) -> None:
+        """Store an object as if it had been created by somebody else than the charm."""
+        with self._lock:
+            prefix, plural = self._endpoint(obj["apiVersion"], obj["kind"])
+            metadata = obj["metadata"]
+            self._store(prefix, plural, metadata["namespace"], metadata["name"], obj)
+
+    def get(self, api_version: str, kind: str, namespace: str, name: str) -> Optional[dict]:
+        """Return a copy of a stored object, if it exists."""
+        prefix, plural = self._endpoint(api_version, kind)
+        with self._lock:
+            return copy.deepcopy(self._objects.get((prefix, plural, namespace, name)))
+
+    def roll_out(self, namespace: str, statefulset_name: str, pod_name: str) -> None:
+        """Bring the Pod in line with the StatefulSet's Pod template, as a rollout would."""
+        with self._lock:
+            statefulset = self._objects[
+                ("/apis/apps/v1", "statefulsets", namespace, statefulset_name)
+            ]
+            pod = self._objects[("/api/v1", "pods", namespace, pod_name)]
+            template = statefulset["spec"]["template"]
+            pod["metadata"]["annotations"].update(
+                copy.deepcopy(template["metadata"].get("annotations", {}))
+            )
+            pod["spec"]["containers"] = copy.deepcopy(template["spec"]["containers"])
+            pod["metadata"]["uid"] = str(uuid.uuid4())
+            self._bump(pod)
+
+    def count(self, method: Optional[str] = None) -> int:
+        """Return the number of requests received, optionally for a single HTTP method."""
+        return sum(1 for request in self.requests if method in (None, request.method))
+
+    def connections(self) -> int:
+        """Return the number of distinct client connections the requests were received on."""
+        return len({request.client_port for request in self.requests})
+
+    def reset(self) -> None:
+        """Forget the requests received so far."""
+        self.requests.clear()
+        self.max_in_flight = 0
+
+    def handle(  # noqa C901
+        self, method: str, path: str, query: Dict[str, List[str]], body: Optional[dict]
+    ) -> Tuple[int, dict]:
+        """Serve a request and return its status code and JSON payload."""
+        match = _PATH_RE.match(path)
+        if not match:
+            return _status(404, "NotFound", f"{path} not found")
+        prefix, namespace, plural, name = match.group("prefix", "namespace", "plural", "name")
+        kind = _KINDS.get((prefix, plural))
+        if kind is None or (kind == "NetworkAttachmentDefinition" and not self.multus_installed):
+            return _status(404, "NotFound", "the server could not find the requested resource")
+        with self._lock:
+            key = (prefix, plural, namespace, name)
+            if method == "GET" and name is None:
+                return 200, self._list(prefix, plural, namespace, kind, query)
+            if method == "GET":
+                if key not in self._objects:
+                    return _status(404, "NotFound", f'{plural} "{name}" not found')
+                return 200, copy.deepcopy(self._objects[key])
+            if method == "POST":
+                assert body is not None
+                name = body["metadata"]["name"]
+                if (prefix, plural, namespace, name) in self._objects:
+                    return _status(409, "AlreadyExists", f'{plural} "{name}" already exists')
+                body["metadata"].setdefault("labels", {})[JUJU_CREATED_BY_LABEL] = self.created_by
+                return 201, self._store(prefix, plural, namespace, name, body)
+            if method == "PUT":
+                if key not in self._objects:
+                    return _status(404, "NotFound", f'{plural} "{name}" not found')
+                assert body is not None
+                return 200, self._store(prefix, plural, namespace, name, body)
+            if method == "PATCH":
+                if key not in self._objects:
+                    return _status(404, "NotFound", f'{plural} "{name}" not found')
+                assert body is not None
+                _merge(self._objects[key], body)
+                self._bump(self._objects[key])
+                return 200, copy.deepcopy(self._objects[key])
+            if method == "DELETE":
+                if self._objects.pop(key, None) is None:
+                    return _status(404, "NotFound", f'{plural} "{name}" not found')
+                return _status(200, "", "deleted", status="Success")
+        return _status(405, "MethodNotAllowed", f"{method} is not supported")
+
+    def _list(
+        self, prefix: str, plural: str, namespace: str, kind: str, query: Dict[str, List[str]]
+    ) -> dict:
+        selector = _parse_label_selector(query.get("labelSelector", [""])[0])
+        items = [
+            copy.deepcopy(obj)
+            for (obj_prefix, obj_plural, obj_namespace, _), obj in self._objects.items()
+            if (obj_prefix, obj_plural, obj_namespace) == (prefix, plural, namespace)
+            and _matches(obj.get("metadata", {}).get("labels") or {}, selector)
+        ]
+        if limit := query.get("limit"):
+            items = items[: int(limit[0])]
+        return {
+            "apiVersion": prefix.split("/", 2)[-1] if prefix.startswith("/apis") else "v1",
+            "kind": f"{kind}List",
+            "metadata": {"resourceVersion": str(self._resource_version)},
+            "items": items,
+        }
+
+    def _store(self, prefix: str, plural: str, namespace: str, name: str, obj: dict) -> dict:
+        obj = copy.deepcopy(obj)
+        metadata = obj.setdefault("metadata", {})
+        metadata.update(name=name, namespace=namespace)
+        metadata.setdefault("uid", str(uuid.uuid4()))
+        self._bump(obj)
+        self._objects[(prefix, plural, namespace, name)] = obj
+        return copy.deepcopy(obj)
+
+    def _bump(self, obj: dict) -> None:
+        self._resource_version += 1
+        obj["metadata"]["resourceVersion"] = str(self._resource_version)
+
+    @staticmethod
+    def _endpoint(api_version: str, kind: str) -> Tuple[str, str]:
+        prefix = "/api/v1" if api_version == "v1" else f"/apis/{api_version}"
+        for (kind_prefix, plural), known_kind in _KINDS.items():
+            if (kind_prefix, known_kind) == (prefix, kind):
+                return prefix, plural
+        raise ValueError(f"Unsupported kind {api_version}/{kind}")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # noqa: N802
+        self._serve("GET")
+
+    def do_POST(self):  # noqa: N802
+        self._serve("POST")
+
+    def do_PUT(self):  # noqa: N802
+        self._serve("PUT")
+
+    def do_PATCH(self):  # noqa: N802
+        self._serve("PATCH")
+
+    def do_DELETE(self):  # noqa: N802
+        self._serve("DELETE")
+
+    def log_message(self, format, *args):
+        pass
+
+    def _serve(self, method: str) -> None:
+        start = time.perf_counter()
+        api: FakeK8sApi = self.server.api  # type: ignore[attr-defined]
+        url = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        raw_body = self.rfile.read(length) if length else b""
+        body = json.loads(raw_body) if raw_body else None
+        with api._lock:
+            api.in_flight += 1
+            api.max_in_flight = max(api.max_in_flight, api.in_flight)
+        time.sleep(api.latency)
+        with api._lock:
+            api.in_flight -= 1
+        code, payload = api.handle(method, url.path, parse_qs(url.query), body)
+        content = json.dumps(payload).encode()
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+        api.requests.append(
+            ApiRequest(
+                method, url.path, time.perf_counter() - start, self.client_address[1], url.query
+            )
+        )
+
+
+def statefulset(namespace: str, name: str, containers: List[str]) -> dict:
+    """Return a minimal StatefulSet, as Juju creates it for a sidecar charm."""
+    labels = {"app.kubernetes.io/name": name}
+    annotations = {"juju.is/version": "3.6.0"}
+    return {
+        "apiVersion": "apps/v1",
+        "kind": "StatefulSet",
+        "metadata": {"name": name, "namespace": namespace, "annotations": annotations},
+        "spec": {
+            "selector": {"matchLabels": labels},
+            "serviceName": f"{name}-endpoints",
+            "template": {
+                "metadata": {"labels": labels, "annotations": annotations},
+                "spec": {"containers": [{"name": container} for container in containers]},
+            },
+        },
+    }
+
+
+def pod(namespace: str, name: str, containers: List[str]) -> dict:
+    """Return a minimal running Pod."""
+    return {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": {
+            "name": name,
+            "namespace": namespace,
+            "annotations": {"juju.is/version": "3.6.0"},
+        },
+        "spec": {"containers": [{"name": container} for container in containers]},
+        "status": {
+            "conditions": [{"type": "Ready", "status": "True"}],
+            "containerStatuses": [
+                {
+                    "name": container,
+                    "image": f"{container}:latest",
+                    "imageID": f"{container}@sha256:{container.encode().hex():0>64}",
+                    "ready": True,
+                    "restartCount": 0,
+                }
+                for container in containers
+            ],
+        },
+    }
+
+
+def _status(code: int, reason: str, message: str, status: str = "Failure") -> Tuple[int, dict]:
+    return code, {
+        "apiVersion": "v1",
+        "kind": "Status",
+        "metadata": {},
+        "status": status,
+        "message": message,
+        "reason": reason,
+        "code": code,
+    }
+
+
+def _merge(target: dict, patch: dict) -> None:
+    """Merge `patch` into `target`, merging lists of named objects by name."""
+    for key, value in patch.items():
+        if value is None:
+            target.pop(key, None)
+        elif isinstance(value, dict) and isinstance(target.get(key), dict):
+            _merge(target[key], value)
+        elif _is_named_list(value) and _is_named_list(target.get(key)):
+            existing = {item["name"]: item for item in target[key]}
+            for item in value:
+                if item["name"] in existing:
+                    _merge(existing[item["name"]], item)
+                else:
+                    target[key].append(copy.deepcopy(item))
+        else:
+            target[key] = copy.deepcopy(value)
+
+
+def _is_named_list(value) -> bool:
+    return isinstance(value, list) and all(
+        isinstance(item, dict) and "name" in item for item in value
+    )
+
+
+def _parse_label_selector(selector: str) -> List[Tuple[str, Optional[str]]]:
+    requirements: List[Tuple[str, Optional[str]]] = []
+    for requirement in filter(None, selector.split(",")):
+        label, _, value = requirement.partition("=")
+        requirements.append((label, value if _ else None))
+    return requirements
+
+
+def _matches(labels: dict, selector: List[Tuple[str, Optional[str]]]) -> bool:
+    return all(
+        label in labels and (value is None or labels[label] == value) for label, value in selector
+    )
@@ -2,36 +2,54 @@
 # Copyright 2024 Canonical Ltd.
 # See LICENSE file for licensing details.
 
+import json
 from unittest.mock import PropertyMock, patch
 
 import pytest
+from lightkube.config.kubeconfig import KubeConfig
 from ops import testing
 
 from charm import OAIRANCUOperator
+from charm_config import _validate_config
+from k8s_client import get_client
+from tests.unit.fake_k8s_api import FakeK8sApi, pod, statefulset
+
+NAMESPACE = "whatever"
+APP_NAME = "oai-ran-cu-k8s"
+POD_NAME = f"{APP_NAME}-0"
+N3_ROUTE = '[{"dst":"192.168.252.0/24","gateway":"192.168.251.1","dev":"n3","flags":[]}]'
 
 
 class CUCharmFixtures:
-    patcher_check_output = patch("charm.check_output")
-    patcher_k8s_privileged = patch("charm.K8sPrivileged")
-    patcher_k8s_multus = patch("charm.KubernetesMultusCharmLib")
-    patcher_publish_gnb_information = patch("charm.FivegCoreGnbRequires.publish_gnb_information")
+    patcher_k8s_multus = patch("k8s_multus.K8sMultus")
+    patcher_publish_gnb_information = patch(
+        "charms.sdcore_nms_k8s.v0.fiveg_core_gnb.FivegCoreGnbRequires.publish_gnb_information"
+    )
     patcher_gnb_core_remote_tac = patch(
-        "charm.FivegCoreGnbRequires.tac", new_callable=PropertyMock
+        "charms.sdcore_nms_k8s.v0.fiveg_core_gnb.FivegCoreGnbRequires.tac",
+        new_callable=PropertyMock,
     )
     patcher_gnb_core_remote_plmns = patch(
-        "charm.FivegCoreGnbRequires.plmns", new_callable=PropertyMock
+        "charms.sdcore_nms_k8s.v0.fiveg_core_gnb.FivegCoreGnbRequires.plmns",
+        new_callable=PropertyMock,
     )
-    patcher_f1_set_information = patch("charm.F1Provides.set_f1_information")
+    patcher_f1_set_information = patch(
+        "charms.oai_ran_cu_k8s.v0.fiveg_f1.F1Provides.set_f1_information"
+    )
+    patcher_k8s_snapshot = patch("k8s_snapshot.K8sSnapshotClient")
+    patcher_start_restart_timer = patch("charm.start_restart_timer")
 
     @pytest.fixture(autouse=True)
     def setUp(self, request):
+        _validate_config.cache_clear()
         self.mock_publish_gnb_information = CUCharmFixtures.patcher_publish_gnb_information.start()
         self.mock_gnb_core_remote_tac = CUCharmFixtures.patcher_gnb_core_remote_tac.start()
         self.mock_gnb_core_remote_plmns = CUCharmFixtures.patcher_gnb_core_remote_plmns.start()
-        self.mock_check_output = CUCharmFixtures.patcher_check_output.start()
         self.mock_f1_set_information = CUCharmFixtures.patcher_f1_set_information.start()
-        self.mock_k8s_privileged = CUCharmFixtures.patcher_k8s_privileged.start().return_value
-        self.mock_k8s_multus = CUCharmFixtures.patcher_k8s_multus.start().return_value
+        self.mock_start_restart_timer = CUCharmFixtures.patcher_start_restart_timer.start()
+        self.mock_k8s_multus_lib = CUCharmFixtures.patcher_k8s_multus.start()
+        self.mock_k8s_multus = self.mock_k8s_multus_lib.return_value
+        self.mock_k8s_snapshot = CUCharmFixtures.patcher_k8s_snapshot.start().return_value
         yield
         request.addfinalizer(self.tearDown)
 
@@ -43,3 +61,74 @@ class CUCharmFixtures:
         self.ctx = testing.Context(
             charm_type=OAIRANCUOperator,
         )
+
+
+class FakeK8sApiFixtures:
+    """Point the charm's lightkube Client to a fake API server holding the unit's Pod."""
+
+    @pytest.fixture(autouse=True)
+    def fake_api(self, monkeypatch):
+        self.api = FakeK8sApi(created_by=APP_NAME)
+        self.api.add(statefulset(NAMESPACE, APP_NAME, containers=["charm", "cu"]))
+        self.api.add(pod(NAMESPACE, POD_NAME, containers=["charm", "cu"]))
+        self.api.start()
+        kubeconfig = KubeConfig.from_dict(
+            {
+                "clusters": [{"name": "fake", "cluster": {"server": self.api.url}}],
+                "users": [{"name": "charm", "user": {"token": "whatever"}}],
+                "contexts": [{"name": "fake", "context": {"cluster": "fake", "user": "charm"}}],
+                "current-context": "fake",
+            }
+        )
+        monkeypatch.setattr(KubeConfig, "from_env", lambda: kubeconfig)
+        get_client.cache_clear()
+        yield
+        get_client.cache_clear()
+        self.api.stop()
+
+
+def ready_state(config_dir: str) -> testing.State:
+    """Return the state of a leader unit whose reconcile inputs are all available.
+
+    Args:
+        config_dir: Local directory mounted as the workload config storage
+    """
+    container = testing.Container(
+        name="cu",
+        mounts={"config": testing.Mount(location="/tmp/conf", source=config_dir)},
+        can_connect=True,
+        execs={
+            testing.Exec(
+                command_prefix=["ip", "-json", "route", "show"], stdout=N3_ROUTE, stderr=""
+            )
+        },
+    )
+    n2_relation = testing.Relation(
+        endpoint="fiveg_n2",
+        interface="fiveg_n2",
+        remote_app_data={
+            "amf_hostname": "amf",
+            "amf_port": "38412",
+            "amf_ip_address": "1.2.3.4",
+        },
+    )
+    core_gnb_relation = testing.Relation(
+        endpoint="fiveg_core_gnb",
+        interface="fiveg_core_gnb",
+        remote_app_data={
+            "tac": "1",
+            "plmns": json.dumps([{"mcc": "001", "mnc": "01", "sst": 1, "sd": None}]),
+        },
+    )
+    return testing.State(
+        model=testing.Model(name=NAMESPACE),
+        leader=True,
+        containers=[container],
+        relations=[n2_relation, core_gnb_relation],
+        networks={
+            testing.Network(
+                "fiveg_n2",
+                bind_addresses=[testing.BindAddress([testing.Address("1.1.1.1")])],
+            )
+        },
+    )
@@ -9,7 +9,7 @@ from charms.oai_ran_cu_k8s.v0.fiveg_f1 import PLMNConfig
 from ops import testing
 from ops.model import ActiveStatus, BlockedStatus, WaitingStatus
 
-from tests.unit.fixtures import CUCharmFixtures
+from tests.unit.fixtures import N3_ROUTE, CUCharmFixtures
 
 
 class TestCharmCollectStatus(CUCharmFixtures):
@@ -50,8 +50,6 @@ class TestCharmCollectStatus(CUCharmFixtures):
 
     def test_given_n2_relation_not_created_when_collect_unit_status_then_status_is_blocked(self):
         with tempfile.TemporaryDirectory() as temp_dir:
-            self.mock_k8s_privileged.is_patched.return_value = True
-            self.mock_check_output.return_value = b"1.1.1.1"
             self.mock_gnb_core_remote_tac.return_value = 2
             self.mock_gnb_core_remote_plmns.return_value = [PLMNConfig(mcc="001", mnc="01", sst=1)]
             config_mount = testing.Mount(
@@ -97,39 +95,21 @@ class TestCharmCollectStatus(CUCharmFixtures):
             name="cu",
             can_connect=True,
         )
-        self.mock_check_output.return_value = b""
+        n2_network = testing.Network("fiveg_n2", bind_addresses=[])
         state_in = testing.State(
-            leader=True, config={}, relations=[n2_relation], containers=[container]
+            leader=True,
+            config={},
+            relations=[n2_relation],
+            containers=[container],
+            networks={n2_network},
         )
 
         state_out = self.ctx.run(self.ctx.on.collect_unit_status(), state_in)
 
         assert state_out.unit_status == WaitingStatus("Waiting for Pod IP address to be available")
 
-    def test_given_charm_statefulset_is_not_patched_when_collect_unit_status_then_status_is_waiting(  # noqa: E501
-        self,
-    ):
-        n2_relation = testing.Relation(endpoint="fiveg_n2", interface="fiveg_n2")
-        self.mock_k8s_privileged.is_patched.return_value = False
-        self.mock_check_output.return_value = b"1.1.1.1"
-        self.mock_gnb_core_remote_tac.return_value = 2
-        self.mock_gnb_core_remote_plmns.return_value = [PLMNConfig(mcc="001", mnc="01", sst=1)]
-        container = testing.Container(
-            name="cu",
-            can_connect=True,
-        )
-        state_in = testing.State(
-            leader=True, config={}, relations=[n2_relation], containers=[container]
-        )
-
-        state_out = self.ctx.run(self.ctx.on.collect_unit_status(), state_in)
-
-        assert state_out.unit_status == WaitingStatus("Waiting for statefulset to be patched")
-
     def test_give_storage_is_not_attached_when_collect_unit_status_then_status_is_waiting(self):
         n2_relation = testing.Relation(endpoint="fiveg_n2", interface="fiveg_n2")
-        self.mock_k8s_privileged.is_patched.return_value = True
-        self.mock_check_output.return_value = b"1.1.1.1"
         self.mock_gnb_core_remote_tac.return_value = 2
         self.mock_gnb_core_remote_plmns.return_value = [PLMNConfig(mcc="001", mnc="01", sst=1)]
         container = testing.Container(
@@ -149,8 +129,6 @@ class TestCharmCollectStatus(CUCharmFixtures):
     ):
         with tempfile.TemporaryDirectory() as temp_dir:
             n2_relation = testing.Relation(endpoint="fiveg_n2", interface="fiveg_n2")
-            self.mock_k8s_privileged.is_patched.return_value = True
-            self.mock_check_output.return_value = b"1.1.1.1"
             self.mock_gnb_core_remote_tac.return_value = 2
             self.mock_gnb_core_remote_plmns.return_value = [PLMNConfig(mcc="001", mnc="01", sst=1)]
             config_mount = testing.Mount(
@@ -184,8 +162,6 @@ class TestCharmCollectStatus(CUCharmFixtures):
             core_gnb_relation = testing.Relation(
                 endpoint="fiveg_core_gnb", interface="fiveg_core_gnb"
             )
-            self.mock_k8s_privileged.is_patched.return_value = True
-            self.mock_check_output.return_value = b"1.1.1.1"
             self.mock_gnb_core_remote_tac.return_value = 2
             self.mock_gnb_core_remote_plmns.return_value = [PLMNConfig(mcc="001", mnc="01", sst=1)]
             config_mount = testing.Mount(
@@ -198,8 +174,8 @@ class TestCharmCollectStatus(CUCharmFixtures):
                 mounts={"config": config_mount},
                 execs={
                     testing.Exec(
-                        command_prefix=["ip", "route", "show"],
-                        stdout="",
+                        command_prefix=["ip", "-json", "route", "show"],
+                        stdout="[]",
                         stderr="",
                     )
                 },
@@ -228,8 +204,6 @@ class TestCharmCollectStatus(CUCharmFixtures):
                     "amf_ip_address": "1.2.3.4",
                 },
             )
-            self.mock_k8s_privileged.is_patched.return_value = True
-            self.mock_check_output.return_value = b"1.1.1.1"
             self.mock_gnb_core_remote_tac.return_value = 2
             plmns = [PLMNConfig(mcc="301", mnc="21", sst=1, sd=55)]
             self.mock_gnb_core_remote_plmns.return_value = plmns
@@ -243,8 +217,8 @@ class TestCharmCollectStatus(CUCharmFixtures):
                 mounts={"config": config_mount},
                 execs={
                     testing.Exec(
-                        command_prefix=["ip", "route", "show"],
-                        stdout="192.168.252.0/24 via 192.168.251.1",
+                        command_prefix=["ip", "-json", "route", "show"],
+                        stdout=N3_ROUTE,
                         stderr="",
                     )
                 },
@@ -283,8 +257,6 @@ class TestCharmCollectStatus(CUCharmFixtures):
             core_gnb_relation = testing.Relation(
                 endpoint="fiveg_core_gnb", interface="fiveg_core_gnb"
             )
-            self.mock_k8s_privileged.is_patched.return_value = True
-            self.mock_check_output.return_value = b"1.1.1.1"
             self.mock_gnb_core_remote_tac.return_value = tac
             self.mock_gnb_core_remote_plmns.return_value = plmns
             config_mount = testing.Mount(
@@ -297,8 +269,8 @@ class TestCharmCollectStatus(CUCharmFixtures):
                 mounts={"config": config_mount},
                 execs={
                     testing.Exec(
-                        command_prefix=["ip", "route", "show"],
-                        stdout="192.168.252.0/24 via 192.168.251.1",
+                        command_prefix=["ip", "-json", "route", "show"],
+                        stdout=N3_ROUTE,
                         stderr="",
                     )
                 },
@@ -330,8 +302,6 @@ class TestCharmCollectStatus(CUCharmFixtures):
             core_gnb_relation = testing.Relation(
                 endpoint="fiveg_core_gnb", interface="fiveg_core_gnb"
             )
-            self.mock_k8s_privileged.is_patched.return_value = True
-            self.mock_check_output.return_value = b"1.1.1.1"
             self.mock_gnb_core_remote_tac.return_value = 2
             plmns = [PLMNConfig(mcc="301", mnc="21", sst=1, sd=55)]
             self.mock_gnb_core_remote_plmns.return_value = plmns
@@ -345,8 +315,8 @@ class TestCharmCollectStatus(CUCharmFixtures):
                 mounts={"config": config_mount},
                 execs={
                     testing.Exec(
-                        command_prefix=["ip", "route", "show"],
-                        stdout="192.168.252.0/24 via 192.168.251.1",
+                        command_prefix=["ip", "-json", "route", "show"],
+                        stdout=N3_ROUTE,
                         stderr="",
                     )
                 },
@@ -373,8 +343,6 @@ class TestCharmCollectStatus(CUCharmFixtures):
                     "amf_ip_address": "1.2.3.4",
                 },
             )
-            self.mock_k8s_privileged.is_patched.return_value = True
-            self.mock_check_output.return_value = b"1.1.1.1"
             config_mount = testing.Mount(
                 source=temp_dir,
                 location="/tmp/conf",
@@ -406,8 +374,6 @@ class TestCharmCollectStatus(CUCharmFixtures):
                     "amf_ip_address": "1.2.3.4",
                 },
             )
-            self.mock_k8s_privileged.is_patched.return_value = True
-            self.mock_check_output.return_value = b"1.1.1.1"
             config_mount = testing.Mount(
                 source=temp_dir,
                 location="/tmp/conf",
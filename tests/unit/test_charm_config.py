@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# Copyright 2024 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from charm_config import CharmConfig, CharmConfigInvalidError, CUConfig, _validate_config
+
+
+class TestCharmConfig:
+    @pytest.fixture(autouse=True)
+    def clear_validated_configs(self):
+        _validate_config.cache_clear()
+        yield
+        _validate_config.cache_clear()
+
+    @staticmethod
+    def _charm(config: dict) -> MagicMock:
+        charm = MagicMock()
+        charm.config = config
+        return charm
+
+    def test_given_same_config_when_from_charm_twice_then_config_is_validated_once(self):
+        config = {"f1-port": 2153}
+
+        with patch("charm_config.CUConfig", wraps=CUConfig) as mock_cu_config:
+            first = CharmConfig.from_charm(self._charm(config))
+            second = CharmConfig.from_charm(self._charm(dict(config)))
+
+        assert first == second
+        assert first.f1_port == 2153
+        mock_cu_config.assert_called_once()
+
+    def test_given_same_config_when_from_charm_twice_then_instances_are_not_shared(self):
+        first = CharmConfig.from_charm(self._charm({"f1-port": 2153}))
+        first.f1_port = 4000
+
+        second = CharmConfig.from_charm(self._charm({"f1-port": 2153}))
+
+        assert first is not second
+        assert second.f1_port == 2153
+
+    def test_given_different_config_when_from_charm_then_each_config_is_validated(self):
+        first = CharmConfig.from_charm(self._charm({"f1-port": 2153}))
+        second = CharmConfig.from_charm(self._charm({"f1-port": 2154}))
+
+        assert (first.f1_port, second.f1_port) == (2153, 2154)
+
+    def test_given_invalid_config_when_from_charm_twice_then_error_is_raised_both_times(self):
+        config = {"f1-port": 2152, "n3-gateway-ip": "not-an-ip"}
+
+        with patch("charm_config.CUConfig", wraps=CUConfig) as mock_cu_config:
+            for _ in range(2):
+                with pytest.raises(CharmConfigInvalidError) as exc_info:
+                    CharmConfig.from_charm(self._charm(config))
+                assert exc_info.value.msg == (
+                    "The following configurations are not valid: ['n3-gateway-ip']"
+                )
+
+        mock_cu_config.assert_called_once()
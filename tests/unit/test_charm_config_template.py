@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# Copyright 2024 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import jinja2
+import pytest
+
+from charm import _get_config_template
+
+Environment = jinja2.Environment
+FileSystemBytecodeCache = jinja2.FileSystemBytecodeCache
+
+
+class TestConfigTemplate:
+    @pytest.fixture(autouse=True)
+    def bytecode_cache_dir(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.bytecode_cache_dir = Path(tmpdir)
+            with patch(
+                "jinja2.FileSystemBytecodeCache",
+                lambda: FileSystemBytecodeCache(tmpdir),
+            ):
+                _get_config_template.cache_clear()
+                yield
+                _get_config_template.cache_clear()
+
+    def test_when_get_config_template_twice_then_template_is_compiled_once(self):
+        with (
+            patch("jinja2.Environment", wraps=Environment) as mock_environment,
+            patch.object(
+                Environment,
+                "compile",
+                autospec=True,
+                side_effect=Environment.compile,
+            ) as mock_compile,
+        ):
+            first = _get_config_template()
+            second = _get_config_template()
+
+        assert first is second
+        mock_environment.assert_called_once()
+        mock_compile.assert_called_once()
+
+    def test_given_template_compiled_by_previous_process_when_get_config_template_then_bytecode_cache_is_used(  # noqa: E501
+        self,
+    ):
+        _get_config_template()
+        assert list(self.bytecode_cache_dir.iterdir())
+        _get_config_template.cache_clear()
+
+        with patch.object(Environment, "compile") as mock_compile:
+            template = _get_config_template()
+
+        mock_compile.assert_not_called()
+        assert "gNBs" in template.render(plmn_list=[])
@@ -2,102 +2,57 @@
 # Copyright 2024 Canonical Ltd.
 # See LICENSE file for licensing details.
 
+import dataclasses
+import hashlib
 import os
 import tempfile
+from unittest.mock import patch
 
 import pytest
+from charms.kubernetes_charm_libraries.v0.multus import KubernetesMultusError
 from charms.oai_ran_cu_k8s.v0.fiveg_f1 import PLMNConfig
+from charms.sdcore_amf_k8s.v0.fiveg_n2 import N2Requires
+from lightkube.models.core_v1 import ContainerStatus, PodStatus
+from lightkube.models.meta_v1 import ObjectMeta
+from lightkube.resources.core_v1 import Pod
 from ops import testing
 from ops.pebble import Layer
 
-from tests.unit.fixtures import CUCharmFixtures
+from tests.unit.fixtures import N3_ROUTE, CUCharmFixtures, ready_state
 
 
 class TestCharmConfigure(CUCharmFixtures):
-    def test_given_statefulset_is_not_patched_when_config_changed_then_statefulset_is_patched(
-        self,
-    ):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            n2_relation = testing.Relation(
-                endpoint="fiveg_n2",
-                interface="fiveg_n2",
-                remote_app_data={
-                    "amf_hostname": "amf",
-                    "amf_port": "38412",
-                    "amf_ip_address": "1.2.3.4",
-                },
-            )
-            core_gnb_relation = testing.Relation(
-                endpoint="fiveg_core_gnb", interface="fiveg_core_gnb"
-            )
-            config_mount = testing.Mount(
-                location="/tmp/conf",
-                source=tmpdir,
-            )
-            container = testing.Container(
-                name="cu",
-                mounts={"config": config_mount},
-                can_connect=True,
-                execs={
-                    testing.Exec(
-                        command_prefix=["ip", "route", "show"],
-                        stdout="192.168.252.0/24 via 192.168.251.1",
-                        stderr="",
-                    )
-                },
-            )
-            state_in = testing.State(
-                leader=True,
-                containers=[container],
-                relations=[n2_relation, core_gnb_relation],
-            )
-            self.mock_k8s_privileged.is_patched.return_value = False
-            self.mock_check_output.return_value = b"1.1.1.1"
+    def test_when_config_changed_then_multus_patch_sets_privileged_security_context(self):
+        container = testing.Container(name="cu", can_connect=True)
+        state_in = testing.State(leader=True, containers=[container])
 
-            self.ctx.run(self.ctx.on.config_changed(), state_in)
+        self.ctx.run(self.ctx.on.config_changed(), state_in)
+
+        _, kwargs = self.mock_k8s_multus_lib.call_args
+        assert kwargs["privileged"] is True
+        assert kwargs["cap_net_admin"] is True
+        self.mock_k8s_multus.configure.assert_called_once()
 
-            self.mock_k8s_privileged.patch_statefulset.assert_called_with(container_name="cu")
+    def test_when_config_changed_then_multus_reads_go_through_the_shared_snapshot_client(self):
+        container = testing.Container(name="cu", can_connect=True)
+        state_in = testing.State(leader=True, containers=[container])
 
-    def test_given_statefulset_is_patched_when_config_changed_then_statefulset_is_not_patched(
+        self.ctx.run(self.ctx.on.config_changed(), state_in)
+
+        _, kwargs = self.mock_k8s_multus_lib.call_args
+        assert kwargs["client"] is self.mock_k8s_snapshot
+
+    def test_given_storage_not_attached_when_config_changed_then_preconditions_are_evaluated_once(  # noqa: E501
         self,
     ):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            n2_relation = testing.Relation(
-                endpoint="fiveg_n2",
-                interface="fiveg_n2",
-                remote_app_data={
-                    "amf_hostname": "amf",
-                    "amf_port": "38412",
-                    "amf_ip_address": "1.2.3.4",
-                },
-            )
-            config_mount = testing.Mount(
-                location="/tmp/conf",
-                source=tmpdir,
-            )
-            container = testing.Container(
-                name="cu",
-                mounts={"config": config_mount},
-                can_connect=True,
-                execs={
-                    testing.Exec(
-                        command_prefix=["ip", "route", "show"],
-                        stdout="192.168.252.0/24 via 192.168.251.1",
-                        stderr="",
-                    )
-                },
-            )
-            state_in = testing.State(
-                leader=True,
-                containers=[container],
-                relations=[n2_relation],
-            )
-            self.mock_k8s_privileged.is_patched.return_value = True
-            self.mock_check_output.return_value = b"1.1.1.1"
+        container = testing.Container(name="cu", can_connect=True)
+        state_in = testing.State(leader=True, containers=[container])
 
-            self.ctx.run(self.ctx.on.config_changed(), state_in)
+        state_out = self.ctx.run(self.ctx.on.config_changed(), state_in)
 
-            self.mock_k8s_privileged.patch_statefulset.assert_not_called()
+        self.mock_k8s_multus.multus_is_available.assert_called_once()
+        self.mock_k8s_multus.is_ready.assert_called_once()
+        assert state_out.unit_status == testing.WaitingStatus("Waiting for storage to be attached")
 
     @pytest.mark.parametrize(
         "plmns,config_file",
@@ -143,20 +98,22 @@ class TestCharmConfigure(CUCharmFixtures):
                 can_connect=True,
                 execs={
                     testing.Exec(
-                        command_prefix=["ip", "route", "show"],
-                        stdout="192.168.252.0/24 via 192.168.251.1",
+                        command_prefix=["ip", "-json", "route", "show"],
+                        stdout=N3_ROUTE,
                         stderr="",
                     )
                 },
             )
+            n2_network = testing.Network(
+                "fiveg_n2", bind_addresses=[testing.BindAddress([testing.Address("1.1.1.1")])]
+            )
             state_in = testing.State(
                 model=testing.Model(name="whatever"),
                 leader=True,
                 containers=[container],
                 relations=[n2_relation, core_gnb_relation],
+                networks={n2_network},
             )
-            self.mock_k8s_privileged.is_patched.return_value = True
-            self.mock_check_output.return_value = b"1.1.1.1"
             self.mock_gnb_core_remote_tac.return_value = 1
             self.mock_gnb_core_remote_plmns.return_value = plmns
 
@@ -191,8 +148,8 @@ class TestCharmConfigure(CUCharmFixtures):
                 can_connect=True,
                 execs={
                     testing.Exec(
-                        command_prefix=["ip", "route", "show"],
-                        stdout="192.168.252.0/24 via 192.168.251.1",
+                        command_prefix=["ip", "-json", "route", "show"],
+                        stdout=N3_ROUTE,
                         stderr="",
                     )
                 },
@@ -203,8 +160,6 @@ class TestCharmConfigure(CUCharmFixtures):
                 containers=[container],
                 relations=[n2_relation],
             )
-            self.mock_k8s_privileged.is_patched.return_value = True
-            self.mock_check_output.return_value = b"1.1.1.1"
             self.mock_gnb_core_remote_tac.return_value = 1
             self.mock_gnb_core_remote_plmns.return_value = [PLMNConfig(mcc="001", mnc="01", sst=1)]
             with open("tests/unit/resources/expected_config.conf") as expected_config_file:
@@ -219,6 +174,83 @@ class TestCharmConfigure(CUCharmFixtures):
                 assert cu_conf.read().strip() == expected_config.strip()
             assert os.stat(tmpdir + "/cu.conf").st_mtime == config_modification_time
 
+    def test_given_digest_of_pushed_config_matches_when_config_changed_then_cu_config_file_is_not_pulled_nor_pushed(  # noqa: E501
+        self,
+    ):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            n2_relation = testing.Relation(
+                endpoint="fiveg_n2",
+                interface="fiveg_n2",
+                remote_app_data={
+                    "amf_hostname": "amf",
+                    "amf_port": "38412",
+                    "amf_ip_address": "1.2.3.4",
+                },
+            )
+            config_mount = testing.Mount(
+                location="/tmp/conf",
+                source=tmpdir,
+            )
+            container = testing.Container(
+                name="cu",
+                mounts={"config": config_mount},
+                can_connect=True,
+                execs={
+                    testing.Exec(
+                        command_prefix=["ip", "-json", "route", "show"],
+                        stdout=N3_ROUTE,
+                        stderr="",
+                    )
+                },
+            )
+            with open("tests/unit/resources/expected_config.conf") as expected_config_file:
+                expected_config = expected_config_file.read().strip()
+            stored_state = testing.StoredState(
+                owner_path="OAIRANCUOperator",
+                content={"cu_config_digest": hashlib.sha256(expected_config.encode()).hexdigest()},
+            )
+            state_in = testing.State(
+                model=testing.Model(name="whatever"),
+                leader=True,
+                containers=[container],
+                relations=[n2_relation],
+                stored_states=[stored_state],
+            )
+            self.mock_gnb_core_remote_tac.return_value = 1
+            self.mock_gnb_core_remote_plmns.return_value = [PLMNConfig(mcc="001", mnc="01", sst=1)]
+            with open(f"{tmpdir}/cu.conf", "w") as cu_conf:
+                cu_conf.write("whatever")
+
+            self.ctx.run(self.ctx.on.config_changed(), state_in)
+
+            with open(f"{tmpdir}/cu.conf") as cu_conf:
+                assert cu_conf.read() == "whatever"
+
+    def test_given_config_storage_attached_when_storage_attached_then_digest_of_pushed_config_is_forgotten(  # noqa: E501
+        self,
+    ):
+        storage = testing.Storage(name="config")
+        container = testing.Container(name="cu", can_connect=False)
+        stored_state = testing.StoredState(
+            owner_path="OAIRANCUOperator",
+            content={"cu_config_digest": "whatever"},
+        )
+        state_in = testing.State(
+            leader=True,
+            containers=[container],
+            storages=[storage],
+            stored_states=[stored_state],
+        )
+
+        state_out = self.ctx.run(self.ctx.on.storage_attached(storage), state_in)
+
+        assert (
+            state_out.get_stored_state("_stored", owner_path="OAIRANCUOperator").content[
+                "cu_config_digest"
+            ]
+            == ""
+        )
+
     def test_given_charm_configuration_is_done_when_config_changed_then_pebble_layer_is_created(
         self,
     ):
@@ -245,8 +277,8 @@ class TestCharmConfigure(CUCharmFixtures):
                 can_connect=True,
                 execs={
                     testing.Exec(
-                        command_prefix=["ip", "route", "show"],
-                        stdout="192.168.252.0/24 via 192.168.251.1",
+                        command_prefix=["ip", "-json", "route", "show"],
+                        stdout=N3_ROUTE,
                         stderr="",
                     )
                 },
@@ -257,8 +289,6 @@ class TestCharmConfigure(CUCharmFixtures):
                 containers=[container],
                 relations=[n2_relation, core_gnb_relation],
             )
-            self.mock_k8s_privileged.is_patched.return_value = True
-            self.mock_check_output.return_value = b"1.1.1.1"
             self.mock_gnb_core_remote_tac.return_value = 67
             plmns = [PLMNConfig(mcc="001", mnc="01", sst=99)]
             self.mock_gnb_core_remote_plmns.return_value = plmns
@@ -306,8 +336,8 @@ class TestCharmConfigure(CUCharmFixtures):
                 can_connect=True,
                 execs={
                     testing.Exec(
-                        command_prefix=["ip", "route", "show"],
-                        stdout="192.168.252.0/24 via 192.168.251.1",
+                        command_prefix=["ip", "-json", "route", "show"],
+                        stdout=N3_ROUTE,
                         stderr="",
                     )
                 },
@@ -318,8 +348,6 @@ class TestCharmConfigure(CUCharmFixtures):
                 containers=[container],
                 relations=[n2_relation, fiveg_core_gnb_relation],
             )
-            self.mock_k8s_privileged.is_patched.return_value = True
-            self.mock_check_output.return_value = b"1.1.1.1"
             self.mock_gnb_core_remote_tac.return_value = None
             self.mock_gnb_core_remote_plmns.return_value = None
 
@@ -359,8 +387,8 @@ class TestCharmConfigure(CUCharmFixtures):
                 can_connect=True,
                 execs={
                     testing.Exec(
-                        command_prefix=["ip", "route", "show"],
-                        stdout="192.168.252.0/24 via 192.168.251.1",
+                        command_prefix=["ip", "-json", "route", "show"],
+                        stdout=N3_ROUTE,
                         stderr="",
                     )
                 },
@@ -371,8 +399,6 @@ class TestCharmConfigure(CUCharmFixtures):
                 containers=[container],
                 relations=[n2_relation, f1_relation, core_gnb_relation],
             )
-            self.mock_k8s_privileged.is_patched.return_value = True
-            self.mock_check_output.return_value = b"1.1.1.1"
             self.mock_gnb_core_remote_tac.return_value = 87
             plmns = [PLMNConfig(mcc="431", mnc="01", sst=17)]
             self.mock_gnb_core_remote_plmns.return_value = plmns
@@ -413,8 +439,8 @@ class TestCharmConfigure(CUCharmFixtures):
                 can_connect=True,
                 execs={
                     testing.Exec(
-                        command_prefix=["ip", "route", "show"],
-                        stdout="192.168.252.0/24 via 192.168.251.1",
+                        command_prefix=["ip", "-json", "route", "show"],
+                        stdout=N3_ROUTE,
                         stderr="",
                     )
                 },
@@ -425,8 +451,6 @@ class TestCharmConfigure(CUCharmFixtures):
                 containers=[container],
                 relations=[n2_relation, fiveg_core_gnb_relation],
             )
-            self.mock_k8s_privileged.is_patched.return_value = True
-            self.mock_check_output.return_value = b"1.1.1.1"
             self.mock_gnb_core_remote_tac.return_value = None
             self.mock_gnb_core_remote_plmns.return_value = None
 
@@ -465,8 +489,8 @@ class TestCharmConfigure(CUCharmFixtures):
                 can_connect=True,
                 execs={
                     testing.Exec(
-                        command_prefix=["ip", "route", "show"],
-                        stdout="192.168.252.0/24 via 192.168.251.1",
+                        command_prefix=["ip", "-json", "route", "show"],
+                        stdout=N3_ROUTE,
                         stderr="",
                     )
                 },
@@ -478,8 +502,6 @@ class TestCharmConfigure(CUCharmFixtures):
                 containers=[container],
                 relations=[n2_relation, f1_relation, core_gnb_relation],
             )
-            self.mock_k8s_privileged.is_patched.return_value = True
-            self.mock_check_output.return_value = b"1.1.1.1"
             self.mock_gnb_core_remote_tac.return_value = 1
             plmns = [PLMNConfig(mcc="001", mnc="01", sst=1, sd=6)]
             self.mock_gnb_core_remote_plmns.return_value = plmns
@@ -493,6 +515,85 @@ class TestCharmConfigure(CUCharmFixtures):
                 plmns=plmns,
             )
 
+    def test_given_charm_is_active_when_config_changed_then_core_gnb_data_is_read_once(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_in = ready_state(tmpdir)
+            state_in = dataclasses.replace(
+                state_in,
+                relations=[
+                    *state_in.relations,
+                    testing.Relation(endpoint="fiveg_f1", interface="fiveg_f1"),
+                ],
+            )
+            self.mock_gnb_core_remote_tac.return_value = 1
+            self.mock_gnb_core_remote_plmns.return_value = [
+                PLMNConfig(mcc="001", mnc="01", sst=1, sd=6)
+            ]
+
+            state_out = self.ctx.run(self.ctx.on.config_changed(), state_in)
+
+            assert state_out.unit_status == testing.ActiveStatus()
+            self.mock_f1_set_information.assert_called_once()
+            assert self.mock_gnb_core_remote_tac.call_count == 1
+            assert self.mock_gnb_core_remote_plmns.call_count == 1
+
+    def test_given_charm_is_active_when_config_changed_then_n2_data_is_read_once(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.mock_gnb_core_remote_tac.return_value = 1
+            self.mock_gnb_core_remote_plmns.return_value = [PLMNConfig(mcc="001", mnc="01", sst=1)]
+
+            with patch.object(
+                N2Requires,
+                "_get_remote_app_relation_data",
+                autospec=True,
+                side_effect=N2Requires._get_remote_app_relation_data,
+            ) as mock_get_n2_data:
+                state_out = self.ctx.run(self.ctx.on.config_changed(), ready_state(tmpdir))
+
+            assert state_out.unit_status == testing.ActiveStatus()
+            mock_get_n2_data.assert_called_once()
+
+    def test_given_n2_relation_not_created_when_config_changed_then_f1_information_is_published(
+        self,
+    ):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            core_gnb_relation = testing.Relation(
+                endpoint="fiveg_core_gnb", interface="fiveg_core_gnb"
+            )
+            f1_relation = testing.Relation(endpoint="fiveg_f1", interface="fiveg_f1")
+            container = testing.Container(
+                name="cu",
+                mounts={"config": testing.Mount(location="/tmp/conf", source=tmpdir)},
+                can_connect=True,
+                execs={
+                    testing.Exec(
+                        command_prefix=["ip", "-json", "route", "show"],
+                        stdout=N3_ROUTE,
+                        stderr="",
+                    )
+                },
+            )
+            state_in = testing.State(
+                leader=True,
+                containers=[container],
+                relations=[f1_relation, core_gnb_relation],
+            )
+            self.mock_gnb_core_remote_tac.return_value = 1
+            plmns = [PLMNConfig(mcc="001", mnc="01", sst=1)]
+            self.mock_gnb_core_remote_plmns.return_value = plmns
+
+            state_out = self.ctx.run(self.ctx.on.config_changed(), state_in)
+
+            self.mock_f1_set_information.assert_called_once_with(
+                ip_address="192.168.254.7",
+                port=2152,
+                tac=1,
+                plmns=plmns,
+            )
+            assert state_out.unit_status == testing.BlockedStatus(
+                "Waiting for N2 relation to be created"
+            )
+
     def test_given_n3_route_not_created_when_config_changed_then_n3_route_is_created(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             n2_relation = testing.Relation(
@@ -521,20 +622,13 @@ class TestCharmConfigure(CUCharmFixtures):
                 can_connect=True,
                 execs={
                     testing.Exec(
-                        command_prefix=["ip", "route", "show"],
-                        stdout="",
+                        command_prefix=["ip", "-json", "route", "show"],
+                        stdout="[]",
                         stderr="",
                     ),
                     testing.Exec(
-                        command_prefix=[
-                            "ip",
-                            "route",
-                            "replace",
-                            "192.168.252.0/24",
-                            "via",
-                            "192.168.251.1",
-                        ],
-                        stdout="",
+                        command_prefix=["ip", "-json", "-batch", "-"],
+                        stdout=N3_ROUTE,
                         stderr="",
                     ),
                 },
@@ -545,19 +639,15 @@ class TestCharmConfigure(CUCharmFixtures):
                 containers=[container],
                 relations=[n2_relation, f1_relation, core_gnb_relation],
             )
-            self.mock_k8s_privileged.is_patched.return_value = True
-            self.mock_check_output.return_value = b"1.1.1.1"
 
             self.ctx.run(self.ctx.on.config_changed(), state_in)
 
-            assert self.ctx.exec_history[container.name][1].command == [
-                "ip",
-                "route",
-                "replace",
-                "192.168.252.0/24",
-                "via",
-                "192.168.251.1",
-            ]
+            route_replace = self.ctx.exec_history[container.name][1]
+            assert route_replace.command == ["ip", "-json", "-batch", "-"]
+            assert route_replace.stdin == (
+                "route replace 192.168.252.0/24 via 192.168.251.1\n"
+                "route show to exact 192.168.252.0/24\n"
+            )
 
     def test_given_n3_route_created_when_config_changed_then_n3_route_is_not_created(self, caplog):
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -584,8 +674,8 @@ class TestCharmConfigure(CUCharmFixtures):
                 can_connect=True,
                 execs={
                     testing.Exec(
-                        command_prefix=["ip", "route", "show"],
-                        stdout="192.168.252.0/24 via 192.168.251.1",
+                        command_prefix=["ip", "-json", "route", "show"],
+                        stdout=N3_ROUTE,
                         stderr="",
                     )
                 },
@@ -596,8 +686,6 @@ class TestCharmConfigure(CUCharmFixtures):
                 containers=[container],
                 relations=[n2_relation, f1_relation],
             )
-            self.mock_k8s_privileged.is_patched.return_value = True
-            self.mock_check_output.return_value = b"1.1.1.1"
 
             self.ctx.run(self.ctx.on.config_changed(), state_in)
 
@@ -605,3 +693,313 @@ class TestCharmConfigure(CUCharmFixtures):
             # instead of validating log content
             # Reference: https://github.com/canonical/ops-testing/issues/180
             assert "N3 route created" not in caplog.text
+
+    def test_given_n3_host_route_created_when_config_changed_then_n3_route_is_not_replaced(
+        self, tmp_path
+    ):
+        self.mock_gnb_core_remote_tac.return_value = 1
+        self.mock_gnb_core_remote_plmns.return_value = [PLMNConfig(mcc="001", mnc="01", sst=1)]
+        container = testing.Container(
+            name="cu",
+            mounts={"config": testing.Mount(location="/tmp/conf", source=tmp_path)},
+            can_connect=True,
+            execs={
+                testing.Exec(
+                    command_prefix=["ip", "-json", "route", "show"],
+                    stdout='[{"dst":"192.168.252.3","gateway":"192.168.251.1","dev":"n3","flags":[]}]',
+                    stderr="",
+                )
+            },
+        )
+        state_in = dataclasses.replace(
+            ready_state(str(tmp_path)),
+            containers=[container],
+            config={"upf-subnet": "192.168.252.3/32"},
+        )
+
+        state_out = self.ctx.run(self.ctx.on.config_changed(), state_in)
+
+        assert state_out.unit_status == testing.ActiveStatus()
+        assert [call.command for call in self.ctx.exec_history[container.name]] == [
+            ["ip", "-json", "route", "show", "to", "exact", "192.168.252.3/32"]
+        ]
+
+    def test_given_unknown_notice_when_pebble_custom_notice_then_workload_is_not_configured(
+        self,
+    ):
+        notice = testing.Notice(key="example.com/whatever")
+        container = testing.Container(name="cu", can_connect=True, notices=[notice])
+        state_in = testing.State(leader=True, containers=[container])
+
+        self.ctx.run(self.ctx.on.pebble_custom_notice(container, notice), state_in)
+
+        self.mock_k8s_multus.configure.assert_not_called()
+
+    def test_given_restart_due_notice_when_pebble_custom_notice_then_workload_is_configured(
+        self,
+    ):
+        notice = testing.Notice(key="canonical.com/oai-ran-cu-k8s/restart-due")
+        container = testing.Container(name="cu", can_connect=True, notices=[notice])
+        state_in = testing.State(leader=True, containers=[container])
+
+        self.ctx.run(self.ctx.on.pebble_custom_notice(container, notice), state_in)
+
+        self.mock_k8s_multus.configure.assert_called_once()
+
+    def _active_state_in(self, tmpdir: str, amf_ip_address: str = "1.2.3.4") -> testing.State:
+        n2_relation = testing.Relation(
+            endpoint="fiveg_n2",
+            interface="fiveg_n2",
+            remote_app_data={
+                "amf_hostname": "amf",
+                "amf_port": "38412",
+                "amf_ip_address": amf_ip_address,
+            },
+        )
+        core_gnb_relation = testing.Relation(endpoint="fiveg_core_gnb", interface="fiveg_core_gnb")
+        container = testing.Container(
+            name="cu",
+            mounts={"config": testing.Mount(location="/tmp/conf", source=tmpdir)},
+            can_connect=True,
+            execs={
+                testing.Exec(
+                    command_prefix=["ip", "-json", "route", "show"],
+                    stdout=N3_ROUTE,
+                    stderr="",
+                )
+            },
+        )
+        return testing.State(
+            leader=True,
+            containers=[container],
+            relations=[n2_relation, core_gnb_relation],
+        )
+
+    def test_given_reconcile_inputs_unchanged_and_service_running_when_update_status_then_workload_is_not_reconfigured(  # noqa: E501
+        self,
+    ):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.mock_gnb_core_remote_tac.return_value = 1
+            self.mock_gnb_core_remote_plmns.return_value = [PLMNConfig(mcc="001", mnc="01", sst=1)]
+            state_after_configure = self.ctx.run(
+                self.ctx.on.config_changed(), self._active_state_in(tmpdir)
+            )
+            self.mock_k8s_multus.reset_mock()
+
+            state_out = self.ctx.run(self.ctx.on.update_status(), state_after_configure)
+
+            self.mock_k8s_multus.multus_is_available.assert_not_called()
+            self.mock_k8s_multus.configure.assert_not_called()
+            assert state_out.unit_status == testing.ActiveStatus()
+
+    def test_given_reconcile_inputs_unchanged_and_service_running_when_update_status_then_multus_helper_is_not_built(  # noqa: E501
+        self,
+    ):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.mock_gnb_core_remote_tac.return_value = 1
+            self.mock_gnb_core_remote_plmns.return_value = [PLMNConfig(mcc="001", mnc="01", sst=1)]
+            state_after_configure = self.ctx.run(
+                self.ctx.on.config_changed(), self._active_state_in(tmpdir)
+            )
+            self.mock_k8s_multus_lib.reset_mock()
+
+            self.ctx.run(self.ctx.on.update_status(), state_after_configure)
+
+            self.mock_k8s_multus_lib.assert_not_called()
+
+    def test_given_reconcile_inputs_changed_when_relation_changed_then_workload_is_reconfigured(
+        self,
+    ):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.mock_gnb_core_remote_tac.return_value = 1
+            self.mock_gnb_core_remote_plmns.return_value = [PLMNConfig(mcc="001", mnc="01", sst=1)]
+            state_after_configure = self.ctx.run(
+                self.ctx.on.config_changed(), self._active_state_in(tmpdir)
+            )
+            self.mock_k8s_multus.reset_mock()
+            core_gnb_relation = dataclasses.replace(
+                state_after_configure.get_relations("fiveg_core_gnb")[0],
+                remote_app_data={"tac": "2"},
+            )
+            state_in = dataclasses.replace(
+                state_after_configure,
+                relations=[core_gnb_relation, state_after_configure.get_relations("fiveg_n2")[0]],
+            )
+
+            self.ctx.run(self.ctx.on.relation_changed(core_gnb_relation), state_in)
+
+            self.mock_k8s_multus.configure.assert_called_once()
+
+    def test_given_multus_was_found_available_when_config_changed_then_multus_is_not_probed_again(  # noqa: E501
+        self,
+    ):
+        container = testing.Container(name="cu", can_connect=True)
+        stored_state = testing.StoredState(
+            owner_path="OAIRANCUOperator", content={"multus_available": True}
+        )
+        state_in = testing.State(leader=True, containers=[container], stored_states=[stored_state])
+
+        self.ctx.run(self.ctx.on.config_changed(), state_in)
+
+        self.mock_k8s_multus.multus_is_available.assert_not_called()
+        self.mock_k8s_multus.configure.assert_called_once()
+
+    def test_given_multus_call_fails_when_config_changed_then_status_is_blocked_and_multus_availability_is_forgotten(  # noqa: E501
+        self,
+    ):
+        container = testing.Container(name="cu", can_connect=True)
+        stored_state = testing.StoredState(
+            owner_path="OAIRANCUOperator", content={"multus_available": True}
+        )
+        state_in = testing.State(leader=True, containers=[container], stored_states=[stored_state])
+        self.mock_k8s_multus.configure.side_effect = KubernetesMultusError(
+            "Could not create NetworkAttachmentDefinition oai-ran-cu-k8s-n3-net"
+        )
+
+        state_out = self.ctx.run(self.ctx.on.config_changed(), state_in)
+
+        assert state_out.unit_status == testing.BlockedStatus(
+            "Could not create NetworkAttachmentDefinition oai-ran-cu-k8s-n3-net"
+        )
+        assert not state_out.get_stored_state("_stored", owner_path="OAIRANCUOperator").content[
+            "multus_available"
+        ]
+
+    def test_given_layer_and_config_change_together_when_config_changed_then_service_is_restarted_once(  # noqa: E501
+        self,
+    ):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.mock_gnb_core_remote_tac.return_value = 1
+            self.mock_gnb_core_remote_plmns.return_value = [PLMNConfig(mcc="001", mnc="01", sst=1)]
+
+            state_out = self.ctx.run(self.ctx.on.config_changed(), self._active_state_in(tmpdir))
+
+            pebble_calls = state_out.get_stored_state(
+                "_stored", owner_path="OAIRANCUOperator"
+            ).content["last_hook_stats"]["calls"]
+            assert pebble_calls["replan"] == 1
+            assert "restart" not in pebble_calls
+
+    def test_given_service_restarted_within_debounce_window_when_config_changes_then_restart_is_deferred(  # noqa: E501
+        self,
+    ):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.mock_gnb_core_remote_tac.return_value = 1
+            self.mock_gnb_core_remote_plmns.return_value = [PLMNConfig(mcc="001", mnc="01", sst=1)]
+            state_in = dataclasses.replace(
+                self._active_state_in(tmpdir), config={"restart-debounce-seconds": 600}
+            )
+            state_after_configure = self.ctx.run(self.ctx.on.config_changed(), state_in)
+            self.mock_gnb_core_remote_tac.return_value = 2
+            core_gnb_relation = dataclasses.replace(
+                state_after_configure.get_relations("fiveg_core_gnb")[0],
+                remote_app_data={"tac": "2"},
+            )
+            state_in = dataclasses.replace(
+                state_after_configure,
+                relations=[core_gnb_relation, state_after_configure.get_relations("fiveg_n2")[0]],
+            )
+
+            state_out = self.ctx.run(self.ctx.on.relation_changed(core_gnb_relation), state_in)
+
+            stored = state_out.get_stored_state("_stored", owner_path="OAIRANCUOperator").content
+            assert "restart" not in stored["last_hook_stats"]["calls"]
+            assert stored["restart_pending"]
+            self.mock_start_restart_timer.assert_called_once()
+            assert self.mock_start_restart_timer.call_args.kwargs["delay"] > 0
+
+    def test_given_restart_pending_and_debounce_window_over_when_restart_due_then_service_is_restarted(  # noqa: E501
+        self,
+    ):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.mock_gnb_core_remote_tac.return_value = 1
+            self.mock_gnb_core_remote_plmns.return_value = [PLMNConfig(mcc="001", mnc="01", sst=1)]
+            state_in = dataclasses.replace(
+                self._active_state_in(tmpdir), config={"restart-debounce-seconds": 600}
+            )
+            state_after_configure = self.ctx.run(self.ctx.on.config_changed(), state_in)
+            stored_state = state_after_configure.get_stored_state(
+                "_stored", owner_path="OAIRANCUOperator"
+            )
+            notice = testing.Notice(key="canonical.com/oai-ran-cu-k8s/restart-due")
+            container = dataclasses.replace(
+                state_after_configure.get_container("cu"), notices=[notice]
+            )
+            state_in = dataclasses.replace(
+                state_after_configure,
+                containers=[container],
+                stored_states=[
+                    dataclasses.replace(
+                        stored_state,
+                        content={
+                            **stored_state.content,
+                            "restart_pending": True,
+                            "last_restart": 0.0,
+                        },
+                    )
+                ],
+            )
+
+            state_out = self.ctx.run(self.ctx.on.pebble_custom_notice(container, notice), state_in)
+
+            stored = state_out.get_stored_state("_stored", owner_path="OAIRANCUOperator").content
+            assert stored["last_hook_stats"]["calls"]["restart"] == 1
+            assert not stored["restart_pending"]
+            self.mock_start_restart_timer.assert_not_called()
+
+    def _workload_version_state_in(self, etc_dir: str, stored: dict) -> testing.State:
+        with open(os.path.join(etc_dir, "workload-version"), "w") as f:
+            f.write("1.2.3")
+        container = testing.Container(
+            name="cu",
+            can_connect=True,
+            mounts={"etc": testing.Mount(location="/etc", source=etc_dir)},
+        )
+        self.mock_k8s_snapshot.get.return_value = Pod(
+            metadata=ObjectMeta(name="oai-ran-cu-k8s-0"),
+            status=PodStatus(
+                containerStatuses=[
+                    ContainerStatus(
+                        name="cu",
+                        image="cu:latest",
+                        imageID="cu@sha256:1234",
+                        ready=True,
+                        restartCount=0,
+                    )
+                ]
+            ),
+        )
+        return testing.State(
+            leader=True,
+            containers=[container],
+            stored_states=[testing.StoredState(owner_path="OAIRANCUOperator", content=stored)],
+        )
+
+    def test_given_new_workload_image_when_config_changed_then_workload_version_is_set(self):
+        with tempfile.TemporaryDirectory() as etc_dir:
+            state_in = self._workload_version_state_in(
+                etc_dir, {"workload_version": "1.2.2", "workload_image_id": "cu@sha256:0000"}
+            )
+
+            state_out = self.ctx.run(self.ctx.on.config_changed(), state_in)
+
+            assert state_out.workload_version == "1.2.3"
+            stored = state_out.get_stored_state("_stored", owner_path="OAIRANCUOperator").content
+            assert stored["workload_version"] == "1.2.3"
+            assert stored["workload_image_id"] == "cu@sha256:1234"
+
+    def test_given_workload_image_unchanged_when_config_changed_then_workload_version_is_not_read_again(  # noqa: E501
+        self,
+    ):
+        with tempfile.TemporaryDirectory() as etc_dir:
+            state_in = self._workload_version_state_in(
+                etc_dir, {"workload_version": "1.2.3", "workload_image_id": "cu@sha256:1234"}
+            )
+
+            state_out = self.ctx.run(self.ctx.on.config_changed(), state_in)
+
+            pebble_calls = state_out.get_stored_state(
+                "_stored", owner_path="OAIRANCUOperator"
+            ).content["last_hook_stats"]["calls"]
+            assert "pull" not in pebble_calls
+            assert state_out.workload_version == ""
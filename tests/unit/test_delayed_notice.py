@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# Copyright 2024 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import os
+import tempfile
+from unittest.mock import MagicMock, patch
+
+import pytest
+from ops import pebble
+
+from delayed_notice import main, process_is_running, start_delayed_notice
+from restart_timer import RESTART_DUE_NOTICE_KEY, start_restart_timer
+
+PEBBLE_SOCKET = "/charm/containers/cu/pebble.socket"
+
+
+class TestDelayedNotice:
+    @pytest.fixture(autouse=True)
+    def pid_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.pid_file = os.path.join(tmpdir, "notice.pid")
+            yield
+
+    @pytest.fixture(autouse=True)
+    def popen(self):
+        with patch("delayed_notice.subprocess.Popen") as mock_popen:
+            self.mock_popen = mock_popen
+            self.mock_popen.return_value.pid = os.getpid()
+            yield
+
+    def _start(self) -> bool:
+        return start_delayed_notice(
+            key="example.com/key", delay=5, pebble_socket=PEBBLE_SOCKET, pid_file=self.pid_file
+        )
+
+    def test_given_no_process_waiting_when_start_then_process_is_started_and_recorded(self):
+        assert self._start()
+
+        args = self.mock_popen.call_args.args[0]
+        assert "--key=example.com/key" in args
+        assert "--delay=5" in args
+        assert f"--pid-file={self.pid_file}" in args
+        assert process_is_running(self.pid_file)
+
+    def test_given_process_waiting_when_start_then_no_process_is_started(self):
+        self._start()
+        self.mock_popen.reset_mock()
+
+        assert not self._start()
+
+        self.mock_popen.assert_not_called()
+
+    def test_given_stale_pid_file_when_start_then_process_is_started(self):
+        with open(self.pid_file, "w") as f:
+            f.write("999999999")
+
+        assert self._start()
+
+    @patch("delayed_notice.time.sleep")
+    @patch("delayed_notice.pebble.Client")
+    def test_given_process_waiting_when_delay_is_over_then_notice_is_recorded_and_pid_file_released(  # noqa: E501
+        self, mock_pebble_client, mock_sleep
+    ):
+        self._start()
+        self.mock_popen.reset_mock()
+        notifications = []
+        mock_pebble_client.return_value.notify.side_effect = lambda *args: notifications.append(
+            (args, os.path.exists(self.pid_file))
+        )
+
+        main(
+            [
+                "--key=example.com/key",
+                "--delay=5",
+                f"--pebble-socket={PEBBLE_SOCKET}",
+                f"--pid-file={self.pid_file}",
+            ]
+        )
+
+        mock_sleep.assert_called_once_with(5.0)
+        mock_pebble_client.assert_called_once_with(socket_path=PEBBLE_SOCKET)
+        assert notifications == [((pebble.NoticeType.CUSTOM, "example.com/key"), False)]
+        assert self._start()
+
+    @patch("delayed_notice.pebble.Client")
+    def test_given_pid_file_of_newer_process_when_notice_is_recorded_then_pid_file_is_kept(
+        self, mock_pebble_client
+    ):
+        with open(self.pid_file, "w") as f:
+            f.write(str(os.getppid()))
+
+        main(
+            [
+                "--key=example.com/key",
+                "--delay=0",
+                f"--pebble-socket={PEBBLE_SOCKET}",
+                f"--pid-file={self.pid_file}",
+            ]
+        )
+
+        assert os.path.exists(self.pid_file)
+        mock_pebble_client.return_value.notify.assert_called_once()
+
+
+class TestRestartTimer:
+    @patch("restart_timer.start_delayed_notice")
+    def test_when_start_restart_timer_then_restart_due_notice_is_requested(
+        self, mock_start_delayed_notice: MagicMock
+    ):
+        start_restart_timer(delay=30, pod_name="cu-0", pebble_socket=PEBBLE_SOCKET)
+
+        kwargs = mock_start_delayed_notice.call_args.kwargs
+        assert kwargs["key"] == RESTART_DUE_NOTICE_KEY
+        assert kwargs["delay"] == 30
+        assert kwargs["pebble_socket"] == PEBBLE_SOCKET
+        assert kwargs["pid_file"].endswith("cu-0-restart-timer.pid")
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# Copyright 2024 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import dataclasses
+import json
+import logging
+import time
+
+import pytest
+from ops import testing
+
+from charm import OAIRANCUOperator
+from tests.unit.fixtures import APP_NAME, NAMESPACE, POD_NAME, FakeK8sApiFixtures, ready_state
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of Kubernetes API requests per hook, for a unit whose Pod was rolled out
+# with the Multus annotations ("steady") or for a unit that was just deployed ("fresh").
+API_CALL_BUDGETS = {
+    "fresh-install": 5,
+    "fresh-config-changed": 10,
+    "steady-config-changed": 3,
+    "steady-update-status": 0,
+    "steady-fiveg-core-gnb-relation-changed": 3,
+    "steady-remove": 10,
+}
+
+
+class TestK8sApiBudget(FakeK8sApiFixtures):
+    @pytest.fixture(autouse=True)
+    def context(self, tmp_path):
+        self.config_dir = str(tmp_path)
+        self.ctx = testing.Context(charm_type=OAIRANCUOperator)
+
+    def _state(self) -> testing.State:
+        return ready_state(self.config_dir)
+
+    def _steady_state(self) -> testing.State:
+        """Deploy the charm, roll the Pod out and configure it up to Active."""
+        state = self.ctx.run(self.ctx.on.config_changed(), self._state())
+        self.api.roll_out(NAMESPACE, statefulset_name=APP_NAME, pod_name=POD_NAME)
+        state = self.ctx.run(self.ctx.on.config_changed(), state)
+        assert state.unit_status == testing.ActiveStatus()
+        return state
+
+    def _run(self, scenario: str, event, state: testing.State) -> testing.State:
+        self.api.reset()
+        start = time.perf_counter()
+        state_out = self.ctx.run(event, state)
+        elapsed = time.perf_counter() - start
+        logger.info(
+            "%s: %d Kubernetes API requests (%.1f ms in the API), hook took %.1f ms",
+            scenario,
+            self.api.count(),
+            sum(request.duration for request in self.api.requests) * 1000,
+            elapsed * 1000,
+        )
+        assert self.api.count() <= API_CALL_BUDGETS[scenario], [
+            (request.method, request.path) for request in self.api.requests
+        ]
+        return state_out
+
+    def test_given_fresh_deployment_when_install_then_api_call_budget_is_respected(self):
+        self._run("fresh-install", self.ctx.on.install(), self._state())
+
+    def test_given_fresh_deployment_when_config_changed_then_api_call_budget_is_respected(self):
+        state_out = self._run("fresh-config-changed", self.ctx.on.config_changed(), self._state())
+
+        assert state_out.unit_status == testing.WaitingStatus("Waiting for Multus to be ready")
+
+    def test_given_fresh_deployment_when_config_changed_then_statefulset_is_written_once(self):
+        self.ctx.run(self.ctx.on.config_changed(), self._state())
+
+        statefulset_writes = [
+            request
+            for request in self.api.requests
+            if "/statefulsets/" in request.path and request.method in ("PATCH", "PUT")
+        ]
+        assert len(statefulset_writes) == 1
+        statefulset = self.api.get("apps/v1", "StatefulSet", NAMESPACE, APP_NAME)
+        assert statefulset
+        template = statefulset["spec"]["template"]
+        assert "k8s.v1.cni.cncf.io/networks" in template["metadata"]["annotations"]
+        cu = next(c for c in template["spec"]["containers"] if c["name"] == "cu")
+        assert cu["securityContext"]["privileged"] is True
+        assert cu["securityContext"]["capabilities"]["add"] == ["NET_ADMIN"]
+
+    def test_given_pod_rolled_out_when_config_changed_then_api_call_budget_is_respected(self):
+        state = self.ctx.run(self.ctx.on.config_changed(), self._state())
+        self.api.roll_out(NAMESPACE, statefulset_name=APP_NAME, pod_name=POD_NAME)
+
+        state_out = self._run("steady-config-changed", self.ctx.on.config_changed(), state)
+
+        assert state_out.unit_status == testing.ActiveStatus()
+
+    def test_given_slow_api_when_install_then_readiness_checks_are_made_concurrently(self):
+        self.api.latency = 0.05
+
+        state_out = self.ctx.run(self.ctx.on.install(), self._state())
+
+        assert state_out.unit_status == testing.WaitingStatus("Waiting for Multus to be ready")
+        assert self.api.max_in_flight > 1
+
+    def test_given_nad_config_serialized_differently_when_config_changed_then_pod_is_not_restarted(  # noqa: E501
+        self,
+    ):
+        state = self._steady_state()
+        for interface in ("n3", "f1"):
+            nad = self.api.get(
+                "k8s.cni.cncf.io/v1",
+                "NetworkAttachmentDefinition",
+                NAMESPACE,
+                f"{APP_NAME}-{interface}-net",
+            )
+            assert nad
+            config = json.loads(nad["spec"]["config"])
+            nad["spec"]["config"] = json.dumps(config, sort_keys=True, indent=2)
+            self.api.add(nad)
+        stored_state = state.get_stored_state("_stored", owner_path="OAIRANCUOperator")
+        state = dataclasses.replace(
+            state,
+            stored_states=[
+                dataclasses.replace(
+                    stored_state, content={**stored_state.content, "reconcile_fingerprint": ""}
+                )
+            ],
+        )
+        self.api.reset()
+
+        self.ctx.run(self.ctx.on.config_changed(), state)
+
+        assert self.api.count("PATCH") == 0
+        assert self.api.count("DELETE") == 0
+        assert self.api.count("POST") == 0
+
+    def test_given_charm_is_active_when_update_status_then_api_call_budget_is_respected(self):
+        state = self._steady_state()
+
+        self._run("steady-update-status", self.ctx.on.update_status(), state)
+
+    def test_given_charm_is_active_when_core_gnb_relation_changed_then_api_call_budget_is_respected(  # noqa: E501
+        self,
+    ):
+        state = self._steady_state()
+        relation = dataclasses.replace(
+            state.get_relations("fiveg_core_gnb")[0],
+            remote_app_data={
+                "tac": "2",
+                "plmns": json.dumps([{"mcc": "001", "mnc": "01", "sst": 1, "sd": None}]),
+            },
+        )
+        state = dataclasses.replace(
+            state, relations=[relation, state.get_relations("fiveg_n2")[0]]
+        )
+
+        self._run(
+            "steady-fiveg-core-gnb-relation-changed", self.ctx.on.relation_changed(relation), state
+        )
+
+    def test_given_charm_is_active_when_remove_then_api_call_budget_is_respected(self):
+        state = self._steady_state()
+
+        self._run("steady-remove", self.ctx.on.remove(), state)
+
+        assert (
+            self.api.get(
+                "k8s.cni.cncf.io/v1",
+                "NetworkAttachmentDefinition",
+                NAMESPACE,
+                f"{APP_NAME}-n3-net",
+            )
+            is None
+        )
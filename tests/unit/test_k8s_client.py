@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+# Copyright 2024 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+from unittest.mock import patch
+
+from lightkube.core.client import Client
+from lightkube.resources.apps_v1 import StatefulSet
+from lightkube.resources.core_v1 import Pod
+from ops import testing
+
+from charm import OAIRANCUOperator
+from k8s_client import get_client
+from tests.unit.fixtures import APP_NAME, NAMESPACE, POD_NAME, FakeK8sApiFixtures, ready_state
+
+
+class TestK8sClient(FakeK8sApiFixtures):
+    def test_given_client_already_created_when_get_client_then_same_client_is_returned(self):
+        assert get_client() is get_client()
+
+    def test_when_several_requests_sent_then_a_single_connection_is_used(self):
+        for _ in range(3):
+            get_client().get(StatefulSet, name=APP_NAME, namespace=NAMESPACE)
+            get_client().get(Pod, name=POD_NAME, namespace=NAMESPACE)
+            list(get_client().list(Pod, namespace=NAMESPACE))
+
+        assert self.api.count() == 9
+        assert self.api.connections() == 1
+
+    def test_when_config_changed_then_a_single_lightkube_client_is_built(self, tmp_path):
+        ctx = testing.Context(charm_type=OAIRANCUOperator)
+
+        with (
+            patch("k8s_client.Client", wraps=Client) as mock_client,
+            patch("charms.kubernetes_charm_libraries.v0.multus.Client") as mock_multus_client,
+        ):
+            ctx.run(ctx.on.config_changed(), ready_state(str(tmp_path)))
+
+        assert self.api.count() > 0
+        mock_client.assert_called_once()
+        mock_multus_client.assert_not_called()
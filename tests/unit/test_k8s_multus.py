@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# Copyright 2024 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import json
+
+from charms.kubernetes_charm_libraries.v0.multus import NetworkAnnotation
+from lightkube.models.meta_v1 import ObjectMeta
+
+from k8s_multus import CREATED_BY_LABEL, CanonicalNetworkAttachmentDefinition, K8sMultus
+from k8s_snapshot import K8sSnapshotClient
+from tests.unit.fixtures import APP_NAME, NAMESPACE, POD_NAME, FakeK8sApiFixtures
+
+NAD_API_VERSION = "k8s.cni.cncf.io/v1"
+NAD_KIND = "NetworkAttachmentDefinition"
+N3_CNI_CONFIG = {"cniVersion": "0.3.1", "type": "macvlan", "master": "n3"}
+
+
+def nad_dict(name: str, config: dict, created_by: str) -> dict:
+    return {
+        "apiVersion": NAD_API_VERSION,
+        "kind": NAD_KIND,
+        "metadata": {
+            "name": name,
+            "namespace": NAMESPACE,
+            "labels": {CREATED_BY_LABEL: created_by},
+        },
+        "spec": {"config": json.dumps(config)},
+    }
+
+
+class TestK8sMultus(FakeK8sApiFixtures):
+    def _k8s_multus(self, config: dict = N3_CNI_CONFIG) -> K8sMultus:
+        return K8sMultus(
+            client=K8sSnapshotClient(),
+            network_attachment_definitions=[
+                CanonicalNetworkAttachmentDefinition(
+                    metadata=ObjectMeta(name=f"{APP_NAME}-n3-net"),
+                    spec={"config": json.dumps(config)},
+                )
+            ],
+            network_annotations=[NetworkAnnotation(name=f"{APP_NAME}-n3-net", interface="n3")],
+            namespace=NAMESPACE,
+            statefulset_name=APP_NAME,
+            pod_name=POD_NAME,
+            container_name="cu",
+            cap_net_admin=True,
+            privileged=True,
+        )
+
+    def _nad(self, name: str):
+        return self.api.get(NAD_API_VERSION, NAD_KIND, NAMESPACE, name)
+
+    def test_given_nads_of_other_apps_and_stale_nad_when_configure_then_only_charm_nads_change(
+        self,
+    ):
+        self.api.add(nad_dict("other-app-n3-net", N3_CNI_CONFIG, created_by="other-app"))
+        self.api.add(nad_dict(f"{APP_NAME}-stale-net", N3_CNI_CONFIG, created_by=APP_NAME))
+
+        self._k8s_multus().configure()
+
+        assert self._nad("other-app-n3-net")
+        assert self._nad(f"{APP_NAME}-stale-net") is None
+        assert self._nad(f"{APP_NAME}-n3-net")
+
+    def test_given_nad_config_changed_when_configure_then_nad_is_recreated_and_pod_deleted(
+        self,
+    ):
+        self._k8s_multus().configure()
+
+        self._k8s_multus(config={**N3_CNI_CONFIG, "master": "eth1"}).configure()
+
+        nad = self._nad(f"{APP_NAME}-n3-net")
+        assert nad
+        assert json.loads(nad["spec"]["config"])["master"] == "eth1"
+        assert self.api.get("v1", "Pod", NAMESPACE, POD_NAME) is None
+
+    def test_given_nad_config_serialized_differently_when_configure_then_nad_is_kept(self):
+        nad = nad_dict(f"{APP_NAME}-n3-net", {}, created_by=APP_NAME)
+        nad["spec"]["config"] = json.dumps(N3_CNI_CONFIG, sort_keys=True, indent=2)
+        self.api.add(nad)
+        k8s_multus = self._k8s_multus()
+
+        k8s_multus.configure()
+
+        assert self.api.count("DELETE") == 0
+        assert self.api.count("POST") == 0
+        assert k8s_multus.kubernetes.network_attachment_definition_is_created(
+            k8s_multus.network_attachment_definitions[0]
+        )
+
+    def test_given_multus_installed_when_multus_is_available_then_a_single_item_is_listed(self):
+        for interface in ("n3", "f1", "n2"):
+            self.api.add(nad_dict(f"other-app-{interface}-net", {}, created_by="other-app"))
+
+        assert self._k8s_multus().multus_is_available()
+
+        assert len(self.api.requests) == 1
+        assert "limit=1" in self.api.requests[0].query
+
+    def test_given_multus_not_installed_when_multus_is_available_then_false_is_returned(self):
+        self.api.multus_installed = False
+
+        assert not self._k8s_multus().multus_is_available()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# Copyright 2024 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+from unittest.mock import MagicMock
+
+from lightkube.models.meta_v1 import ObjectMeta
+from lightkube.resources.apps_v1 import StatefulSet
+from lightkube.resources.core_v1 import Pod
+
+from k8s_snapshot import K8sSnapshotClient
+
+
+class TestK8sSnapshotClient:
+    def setup_method(self):
+        self.mock_client = MagicMock()
+        self.snapshot = K8sSnapshotClient(client=self.mock_client)
+
+    def test_given_object_already_fetched_when_get_then_object_is_served_from_snapshot(self):
+        statefulset = StatefulSet(metadata=ObjectMeta(name="cu"), spec=None)
+        self.mock_client.get.return_value = statefulset
+
+        first = self.snapshot.get(StatefulSet, "cu", namespace="whatever")
+        second = self.snapshot.get(StatefulSet, "cu", namespace="whatever")
+
+        assert first is second is statefulset
+        self.mock_client.get.assert_called_once_with(StatefulSet, "cu", namespace="whatever")
+
+    def test_given_objects_already_listed_when_get_then_object_is_served_from_list(self):
+        pod = Pod(metadata=ObjectMeta(name="cu-0"))
+        self.mock_client.list.return_value = iter([pod])
+
+        assert list(self.snapshot.list(Pod, namespace="whatever")) == [pod]
+        assert list(self.snapshot.list(Pod, namespace="whatever")) == [pod]
+        assert self.snapshot.get(Pod, "cu-0", namespace="whatever") is pod
+
+        self.mock_client.list.assert_called_once()
+        self.mock_client.get.assert_not_called()
+
+    def test_given_objects_listed_with_label_selector_when_get_then_object_is_served_from_list(
+        self,
+    ):
+        pod = Pod(metadata=ObjectMeta(name="cu-0", labels={"app": "cu"}))
+        self.mock_client.list.return_value = iter([pod])
+
+        list(self.snapshot.list(Pod, namespace="whatever", labels={"app": "cu"}))
+
+        assert self.snapshot.get(Pod, "cu-0", namespace="whatever") is pod
+        self.mock_client.get.assert_not_called()
+
+    def test_given_object_is_written_when_get_then_object_is_fetched_again(self):
+        statefulset = StatefulSet(metadata=ObjectMeta(name="cu"), spec=None)
+        self.mock_client.get.return_value = statefulset
+        self.snapshot.get(StatefulSet, "cu", namespace="whatever")
+
+        self.snapshot.patch(StatefulSet, "cu", statefulset, namespace="whatever")
+        self.snapshot.get(StatefulSet, "cu", namespace="whatever")
+
+        assert self.mock_client.get.call_count == 2
+
+    def test_given_other_kind_is_written_when_get_then_object_is_served_from_snapshot(self):
+        self.mock_client.get.return_value = StatefulSet(metadata=ObjectMeta(name="cu"), spec=None)
+        self.snapshot.get(StatefulSet, "cu", namespace="whatever")
+
+        self.snapshot.delete(Pod, "cu-0", namespace="whatever")
+        self.snapshot.get(StatefulSet, "cu", namespace="whatever")
+
+        self.mock_client.get.assert_called_once()
+
+    def test_given_chunked_list_when_list_then_list_is_passed_through_lazily(self):
+        pods = iter([Pod(metadata=ObjectMeta(name="cu-0")), Pod(metadata=ObjectMeta(name="cu-1"))])
+        self.mock_client.list.return_value = pods
+
+        listed = self.snapshot.list(Pod, namespace="whatever", chunk_size=1)
+
+        assert next(listed).metadata.name == "cu-0"  # type: ignore[union-attr]
+        assert next(pods).metadata.name == "cu-1"  # type: ignore[union-attr]
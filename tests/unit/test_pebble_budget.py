@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# Copyright 2024 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import pytest
+from charms.oai_ran_cu_k8s.v0.fiveg_f1 import PLMNConfig
+from ops import testing
+
+from tests.unit.fixtures import CUCharmFixtures, ready_state
+
+# Maximum number of Pebble calls per hook.
+PEBBLE_CALL_BUDGETS = {
+    "install": 4,
+    "config-changed": 11,
+    "update-status": 2,
+}
+
+
+class TestPebbleBudget(CUCharmFixtures):
+    @pytest.fixture(autouse=True)
+    def config_dir(self, tmp_path):
+        self.config_dir = str(tmp_path)
+
+    def _state(self) -> testing.State:
+        self.mock_gnb_core_remote_tac.return_value = 1
+        self.mock_gnb_core_remote_plmns.return_value = [PLMNConfig(mcc="001", mnc="01", sst=1)]
+        return ready_state(self.config_dir)
+
+    def _run(self, event, state: testing.State) -> testing.State:
+        state_out = self.ctx.run(event, state)
+        stats = state_out.get_stored_state("_stored", owner_path="OAIRANCUOperator").content[
+            "last_hook_stats"
+        ]
+        assert stats["total-calls"] <= PEBBLE_CALL_BUDGETS[stats["hook"]], stats["calls"]
+        return state_out
+
+    def test_when_install_then_pebble_call_budget_is_respected(self):
+        self._run(self.ctx.on.install(), self._state())
+
+    def test_given_workload_can_be_configured_when_config_changed_then_pebble_call_budget_is_respected(  # noqa: E501
+        self,
+    ):
+        state_out = self._run(self.ctx.on.config_changed(), self._state())
+
+        assert state_out.unit_status == testing.ActiveStatus()
+
+    def test_given_charm_is_active_when_update_status_then_pebble_call_budget_is_respected(
+        self,
+    ):
+        state = self.ctx.run(self.ctx.on.config_changed(), self._state())
+
+        self._run(self.ctx.on.update_status(), state)
+
+    def test_given_hook_was_recorded_when_hook_stats_action_then_pebble_calls_are_reported(
+        self,
+    ):
+        state = self.ctx.run(self.ctx.on.config_changed(), self._state())
+
+        self.ctx.run(self.ctx.on.action("hook-stats"), state)
+
+        assert self.ctx.action_results
+        assert self.ctx.action_results["pebble"]["hook"] == "config-changed"
+        assert self.ctx.action_results["pebble"]["calls"]["get-plan"] == 1
+
+    def test_given_no_hook_was_recorded_when_hook_stats_action_then_action_fails(self):
+        with pytest.raises(testing.ActionFailed):
+            self.ctx.run(self.ctx.on.action("hook-stats"), self._state())
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# Copyright 2024 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import dataclasses
+from unittest.mock import MagicMock
+
+import pytest
+from charms.sdcore_nms_k8s.v0.fiveg_core_gnb import PLMNConfig
+
+from relation_data import PLMN, AmfEndpoint, CoreGnbInfo, read_amf_endpoint, read_core_gnb_info
+
+
+class TestReadAmfEndpoint:
+    def test_given_n2_data_when_read_amf_endpoint_then_relation_data_is_read_once(self):
+        requirer = MagicMock()
+        requirer._get_remote_app_relation_data.return_value = {
+            "amf_ip_address": "1.2.3.4",
+            "amf_hostname": "amf.example.com",
+            "amf_port": "38412",
+        }
+
+        amf_endpoint = read_amf_endpoint(requirer)
+
+        assert amf_endpoint == AmfEndpoint(
+            ip_address="1.2.3.4", hostname="amf.example.com", port=38412
+        )
+        requirer._get_remote_app_relation_data.assert_called_once_with()
+
+    def test_given_no_valid_n2_data_when_read_amf_endpoint_then_none_is_returned(self):
+        requirer = MagicMock()
+        requirer._get_remote_app_relation_data.return_value = None
+
+        assert read_amf_endpoint(requirer) is None
+
+
+class TestReadCoreGnbInfo:
+    @staticmethod
+    def _requirer(tac, plmns) -> MagicMock:
+        requirer = MagicMock()
+        requirer.tac = tac
+        requirer.plmns = plmns
+        return requirer
+
+    def test_given_tac_and_plmns_when_read_core_gnb_info_then_immutable_copy_is_returned(self):
+        plmn = PLMNConfig(mcc="001", mnc="01", sst=1, sd=1056816)
+
+        core_gnb_info = read_core_gnb_info(self._requirer(1, [plmn]))
+        plmn.mcc = "999"
+
+        assert core_gnb_info == CoreGnbInfo(
+            tac=1, plmns=(PLMN(mcc="001", mnc="01", sst=1, sd=1056816),)
+        )
+        assert core_gnb_info
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            core_gnb_info.plmns[0].mcc = "999"  # type: ignore[misc]
+
+    @pytest.mark.parametrize(
+        "tac,plmns",
+        [
+            pytest.param(None, [PLMNConfig(mcc="001", mnc="01", sst=1)], id="no_tac"),
+            pytest.param(1, None, id="no_plmns"),
+            pytest.param(1, [], id="empty_plmns"),
+        ],
+    )
+    def test_given_incomplete_data_when_read_core_gnb_info_then_none_is_returned(self, tac, plmns):
+        assert read_core_gnb_info(self._requirer(tac, plmns)) is None
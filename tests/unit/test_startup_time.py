@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# Copyright 2024 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import json
+import logging
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+logger = logging.getLogger(__name__)
+
+REPO_ROOT = Path(__file__).parents[2]
+
+# Modules too slow to import on every dispatch, unless the code path needs them.
+HEAVY_MODULES = ("charms.loki_k8s", "httpx", "jinja2", "lightkube", "pydantic")
+
+# Dispatches the charm for one event in a fresh interpreter, so that nothing is imported yet,
+# and reports the time spent and the modules imported on top of the test framework.
+COLD_START_SCRIPT = """
+import json
+import sys
+import time
+
+from ops import testing
+
+baseline = set(sys.modules)
+start = time.perf_counter()
+import charm
+
+ctx = testing.Context(charm_type=charm.OAIRANCUOperator)
+if sys.argv[1]:
+    ctx.run(getattr(ctx.on, sys.argv[1])(), testing.State(leader=False))
+print(json.dumps({
+    "elapsed": time.perf_counter() - start,
+    "modules": sorted(set(sys.modules) - baseline),
+}))
+"""
+
+
+def _cold_start(event: str) -> dict:
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(["lib", "src"])}
+    result = subprocess.run(
+        [sys.executable, "-c", COLD_START_SCRIPT, event],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def _heavy_modules(modules: list) -> list:
+    return [
+        module
+        for module in modules
+        if any(module == heavy or module.startswith(f"{heavy}.") for heavy in HEAVY_MODULES)
+    ]
+
+
+def test_when_charm_module_is_imported_then_heavy_modules_are_not_imported():
+    cold_start = _cold_start("")
+
+    logger.info("import charm: %.1f ms", cold_start["elapsed"] * 1000)
+    assert _heavy_modules(cold_start["modules"]) == []
+
+
+@pytest.mark.parametrize(
+    "event", ["install", "start", "config_changed", "update_status", "upgrade_charm"]
+)
+def test_given_unit_is_not_leader_when_event_is_dispatched_then_heavy_modules_are_not_imported(
+    event,
+):
+    cold_start = _cold_start(event)
+
+    logger.info("non-leader %s cold start: %.1f ms", event, cold_start["elapsed"] * 1000)
+    assert _heavy_modules(cold_start["modules"]) == []